@@ -2,6 +2,7 @@
 Main Telegram bot for Job Deadline Tracker.
 """
 
+import asyncio
 import logging
 import sys
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
@@ -245,7 +246,7 @@ async def process_job_url(update: Update, context: ContextTypes.DEFAULT_TYPE, ur
         logger.info(f"Scraping URL: {url}")
         await processing_msg.edit_text("⏳ Fetching job details from URL...")
         
-        scrape_result = scraper.fetch_job_text(url)
+        scrape_result = await scraper.fetch_job_text_async(url)
         
         # Check if scraping failed
         if not scrape_result['success']:
@@ -269,7 +270,9 @@ async def process_job_url(update: Update, context: ContextTypes.DEFAULT_TYPE, ur
         logger.info("Extracting job details from scraped text")
         await processing_msg.edit_text("⏳ Extracting job information...")
         
-        job_data = extractor.extract_job_details(job_text, url)
+        # Extraction blocks on regex, dateparser and Ollama, so it runs in a
+        # worker thread to keep reminders and other users' messages moving
+        job_data = await asyncio.to_thread(extractor.extract_job_details, job_text, url)
         
         # Step 3: Save and confirm
         await save_and_confirm_job(update, context, job_data, processing_msg)
@@ -298,7 +301,8 @@ async def process_job_text(update: Update, context: ContextTypes.DEFAULT_TYPE, t
         logger.info("Extracting job details from pasted text")
         await processing_msg.edit_text("⏳ Extracting job information from text...")
         
-        job_data = extractor.extract_job_details(text, url)
+        # Runs in a worker thread so the event loop stays free (see process_job_url)
+        job_data = await asyncio.to_thread(extractor.extract_job_details, text, url)
         
         # If no URL was provided, ask the user for it
         if not url:
@@ -529,6 +533,21 @@ async def error_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     logger.error(f"Update {update} caused error {context.error}", exc_info=context.error)
 
 
+async def post_init(application: Application):
+    """Start the reminder scheduler on the bot's event loop."""
+    logger.info("Setting up reminder scheduler")
+    try:
+        reminder.schedule_reminders(application.bot)
+    except Exception as e:
+        logger.error(f"Failed to setup reminders: {str(e)}")
+        logger.warning("Continuing without reminder system")
+
+
+async def post_shutdown(application: Application):
+    """Stop the reminder scheduler before the event loop closes."""
+    reminder.stop_scheduler()
+
+
 def main():
     """Main function to run the bot."""
     logger.info("Starting Job Deadline Tracker Bot")
@@ -553,8 +572,26 @@ def main():
         logger.error(f"Failed to initialize Google Sheets: {str(e)}")
         logger.warning("Continuing without Google Sheets integration")
     
+    # Load dateparser's language data and the Ollama model before the first
+    # posting arrives
+    try:
+        extractor.warm_up_date_parser()
+    except Exception as e:
+        logger.warning(f"Failed to warm up date parser: {str(e)}")
+    
+    try:
+        extractor.warm_up_ollama()
+    except Exception as e:
+        logger.warning(f"Failed to preload Ollama model: {str(e)}")
+    
     # Create application
-    application = Application.builder().token(config.TELEGRAM_BOT_TOKEN).build()
+    application = (
+        Application.builder()
+        .token(config.TELEGRAM_BOT_TOKEN)
+        .post_init(post_init)
+        .post_shutdown(post_shutdown)
+        .build()
+    )
     
     # Add command handlers
     application.add_handler(CommandHandler("start", start_command))
@@ -571,14 +608,6 @@ def main():
     # Add error handler
     application.add_error_handler(error_handler)
     
-    # Setup reminder scheduler
-    logger.info("Setting up reminder scheduler")
-    try:
-        reminder.schedule_reminders(application.bot)
-    except Exception as e:
-        logger.error(f"Failed to setup reminders: {str(e)}")
-        logger.warning("Continuing without reminder system")
-    
     # Start the bot
     logger.info("Bot is ready and polling for updates")
     application.run_polling(allowed_updates=Update.ALL_TYPES)
@@ -15,7 +15,8 @@ TELEGRAM_USER_ID = os.getenv('TELEGRAM_USER_ID')
 
 # Ollama Configuration (Local LLM)
 OLLAMA_MODEL = 'llama3.2'  # Model to use for extraction
-OLLAMA_HOST = 'http://localhost:11434'  # Default Ollama server
+OLLAMA_HOST = os.getenv('OLLAMA_HOST', 'http://localhost:11434')  # Default Ollama server
+OLLAMA_KEEP_ALIVE = os.getenv('OLLAMA_KEEP_ALIVE', '30m')  # How long Ollama keeps the model loaded between requests
 
 # Jina AI Reader
 JINA_API_KEY = os.getenv('JINA_API_KEY', '')
@@ -34,6 +35,7 @@ REMINDER_DAYS = [3, 1, 0]  # Days before deadline to send reminders
 REMINDER_TIME_HOUR = 8  # 8 AM Bangladesh time
 
 # Date Regex Patterns for deadline extraction
+# Matched against lowercased text, so keep them lowercase
 DATE_PATTERNS = [
     r'deadline[:\s]+(\d{1,2}[\/\-\.]\d{1,2}[\/\-\.]\d{2,4})',
     r'apply\s+by[:\s]+(\d{1,2}\s+\w+\s+\d{4})',
@@ -67,5 +69,17 @@ LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 # Request timeout (seconds)
 REQUEST_TIMEOUT = 30
 
+# Response bodies are read in chunks and cut off at this size (bytes)
+MAX_SCRAPE_BYTES = 2 * 1024 * 1024
+
+# Scheduled reminder jobs are stored here (needs SQLAlchemy) so a run
+# missed while the bot was down fires on the next start
+SCHEDULER_DB = os.getenv('SCHEDULER_DB', '.cache/scheduler.sqlite')
+SCHEDULER_MISFIRE_GRACE_TIME = 60 * 60  # seconds
+
+# Scraped page cache: repeat submissions of a URL within the TTL skip the network
+SCRAPE_CACHE_DIR = os.getenv('SCRAPE_CACHE_DIR', '.cache/scraper')
+SCRAPE_CACHE_TTL = 24 * 60 * 60  # seconds
+
 # Maximum job description length in sheet
 MAX_DESCRIPTION_LENGTH = 200
@@ -5,11 +5,16 @@ Job detail extraction using regex patterns and Ollama (local LLM).
 import logging
 import re
 import json
+import hashlib
+import threading
 import traceback
-from datetime import datetime
-from typing import Optional, Dict
-import dateparser
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Optional, Dict, List
 import config
+import utils
 
 # Default values for missing job data
 DEFAULT_COMPANY = 'Unknown Company'
@@ -20,6 +25,17 @@ MAX_SALARY_TEXT_LENGTH = 150
 MAX_LOCATION_TEXT_LENGTH = 200
 MAX_COMPANY_TEXT_LENGTH = 100
 
+# Labels like "Company:" or "Salary:" sit near the top of a posting, so
+# labeled patterns only accept labels starting in this many characters
+LABELED_SEARCH_LENGTH = 2500
+# Labeled searches read this much further, so a label starting just before
+# the limit is still seen whole; its value is then matched on the full text
+LABELED_SEARCH_OVERHANG = 100
+
+# The deadline scan reads the whole posting; scraped pages can be huge, so
+# it stops after this many characters
+MAX_DEADLINE_SCAN_LENGTH = 200_000
+
 # Import Ollama for local LLM extraction
 logger = logging.getLogger(__name__)
 
@@ -30,124 +46,768 @@ except ImportError:
     OLLAMA_AVAILABLE = False
     logger.warning("Ollama not installed. Run: pip install ollama")
 
+# Global Ollama client instance
+_ollama_client = None
+
+# Extraction results for recently seen postings, keyed by (text digest, local
+# date) so relative deadlines are re-resolved each day; oldest entries first
+EXTRACTION_CACHE_SIZE = 2048
+_extraction_cache = OrderedDict()
+_extraction_cache_lock = threading.Lock()
+
+# Context window for single-posting requests: a 5000-character posting is
+# about 1500 tokens in English and up to about 3000 in Bengali, plus the
+# instructions and answer. Every single-posting request uses the same value
+# because Ollama reloads the model whenever num_ctx changes
+EXTRACTION_CONTEXT = 4096
+
+# Postings sent to Ollama per batch request, and the context window that
+# leaves room for that many 5000-character postings plus their answers
+EXTRACTION_BATCH_SIZE = 4
+EXTRACTION_BATCH_CONTEXT = 8192
+# Batch requests kept in flight at once, so Ollama works on one batch
+# while the bot cleans up the previous one
+EXTRACTION_BATCH_WORKERS = 2
+
+# Fields the combined extraction asks for, with the hint given to the model
+# and the longest value accepted as a real answer
+EXTRACTION_FIELDS = {
+    'company': ('company name (check headers, "Company:", "Organization:", "About us:", email domains, footer)', MAX_COMPANY_TEXT_LENGTH),
+    'position': ('job title (check "Job Title:", "Position:", "Role:", "Vacancy:", "Hiring for:", the first lines)', 150),
+    'location': ('work location with full address if given (city like Dhaka, area like Gulshan, or "Remote")', MAX_LOCATION_TEXT_LENGTH),
+    'salary': ('salary info with currency (BDT, USD, $, ৳, Tk.), full range and suffixes like (Monthly) or (Negotiable)', MAX_SALARY_TEXT_LENGTH),
+    'deadline': ('application deadline in YYYY-MM-DD format', 50),
+    'description': ('ONE sentence summary of the job, max 200 characters', 250),
+}
+
+# Import RE2 for linear-time scanning of job posting text (optional)
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+    logger.info("google-re2 not installed, using Python re for extraction patterns")
+
+# Import pyahocorasick for single-pass city/area keyword lookup (optional)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Python's \d and \s are Unicode-aware; RE2's are ASCII-only, so they are
+# widened to keep Bengali digits and non-breaking spaces matching the same way.
+# RE2 has no Unicode \b, so patterns using it always stay on re.
+_RE2_CLASS_BODIES = {
+    'd': r'\p{Nd}',
+    's': r'\s\p{Z}\x{0b}\x{1c}-\x{1f}\x{85}',
+}
+_RE2_INLINE_FLAGS = ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'))
+
+# (pattern, flags) of every scanner built by _compile_scanner, including
+# those kept on re, so tests can check them all against RE2
+_SCANNER_SOURCES = []
+
+
+def _to_re2_syntax(pattern: str) -> str:
+    """
+    Rewrite a Python regex so RE2 treats \\d and \\s like Python does.
+    
+    Args:
+        pattern: Python regex pattern
+        
+    Returns:
+        Equivalent RE2 pattern
+    """
+    result = []
+    in_class = False
+    idx = 0
+    while idx < len(pattern):
+        char = pattern[idx]
+        if char == '\\' and idx + 1 < len(pattern):
+            escaped = pattern[idx + 1]
+            body = _RE2_CLASS_BODIES.get(escaped)
+            if body is None:
+                result.append(pattern[idx:idx + 2])
+            elif in_class or escaped == 'd':
+                result.append(body)
+            else:
+                result.append(f'[{body}]')
+            idx += 2
+            continue
+        if char == '[' and not in_class:
+            in_class = True
+        elif char == ']' and in_class:
+            in_class = False
+        result.append(char)
+        idx += 1
+    return ''.join(result)
+
+
+def _re2_source(pattern: str, flags: int = 0) -> str:
+    """
+    Translate a Python pattern and its flags into RE2 syntax.
+    
+    Args:
+        pattern: Python regex pattern
+        flags: re module flags (IGNORECASE, MULTILINE, DOTALL)
+        
+    Returns:
+        RE2 pattern with the flags inlined
+    """
+    inline = ''.join(letter for flag, letter in _RE2_INLINE_FLAGS if flags & flag)
+    re2_pattern = _to_re2_syntax(pattern)
+    return f'(?{inline}){re2_pattern}' if inline else re2_pattern
+
+
+def _compile_scanner(pattern: str, flags: int = 0):
+    """
+    Compile a pattern that scans whole job postings.
+    Uses RE2 when available so matching stays linear in the text length;
+    short cleanup patterns stay on re, which is faster for tiny strings.
+    
+    Args:
+        pattern: Python regex pattern
+        flags: re module flags (IGNORECASE, MULTILINE, DOTALL)
+        
+    Returns:
+        Compiled pattern with the re.Pattern search/findall/finditer API
+    """
+    _SCANNER_SOURCES.append((pattern, flags))
+    if RE2_AVAILABLE and r'\b' not in pattern:
+        try:
+            return re2.compile(_re2_source(pattern, flags))
+        except re2.error as e:
+            logger.warning(f"RE2 cannot compile pattern, using re instead: {e}")
+    return re.compile(pattern, flags)
+
+
+def _compile_label_union(patterns, fused_anchors, flags: int = 0):
+    """
+    Fuse "Label:" patterns into one scanner. Their captured values cannot
+    contain a colon, so as long as no label starts with a word that ends
+    another label's value, one label's match never swallows another and a
+    single pass finds the first match of each.
+    
+    Args:
+        patterns: (anchor, pattern) pairs, each pattern with one capture group
+        fused_anchors: Anchors of the patterns to fuse
+        flags: re module flags (IGNORECASE, MULTILINE, DOTALL)
+        
+    Returns:
+        Tuple of the compiled union and the indexes of the fused patterns;
+        the pattern at index idx captures into the group named p{idx}
+    """
+    alternatives = []
+    indexes = []
+    for idx, (anchor, pattern) in enumerate(patterns):
+        if anchor not in fused_anchors:
+            continue
+        capture = re.search(r'(?<!\\)\((?!\?)', pattern).start()
+        alternatives.append(f'(?:{pattern[:capture]}(?P<p{idx}>{pattern[capture + 1:]})')
+        indexes.append(idx)
+    return _compile_scanner('|'.join(alternatives), flags), frozenset(indexes)
+
+
+def _search_labeled(pattern, text: str, pos: int = 0):
+    """
+    Find the first match of a "Label: value" pattern whose label starts in
+    the first LABELED_SEARCH_LENGTH characters. Only the label's start is
+    limited: the match is re-run on the whole text, so a value running
+    past the limit is not cut short.
+    
+    Args:
+        pattern: Compiled "Label: value" pattern
+        text: Job posting text
+        pos: Index to start searching at
+        
+    Returns:
+        Match on the whole text, or None
+    """
+    while True:
+        match = pattern.search(text, pos, LABELED_SEARCH_LENGTH + LABELED_SEARCH_OVERHANG)
+        if not match or match.start() >= LABELED_SEARCH_LENGTH:
+            return None
+        # The limited search can end a value early at its end ($ or a lazy
+        # run); the same start on the whole text gives the real match
+        full_match = pattern.match(text, match.start())
+        if full_match:
+            return full_match
+        pos = match.start() + 1
+
+
+def _first_label_values(union_re, text: str) -> Dict[int, str]:
+    """
+    Scan for every fused label pattern at once (see _compile_label_union).
+    
+    Args:
+        union_re: Union compiled by _compile_label_union
+        text: Job posting text
+        
+    Returns:
+        Dictionary mapping pattern index to the value its first match captured
+    """
+    values = {}
+    match = _search_labeled(union_re, text)
+    while match:
+        idx = int(match.lastgroup[1:])
+        if idx not in values:
+            values[idx] = match.group(match.lastgroup)
+        match = _search_labeled(union_re, text, match.end())
+    return values
+
+# Bangladesh cities and Dhaka areas for location matching
+BANGLADESH_CITIES = ['Dhaka', 'Chittagong', 'Sylhet', 'Khulna', 'Rajshahi', 'Rangpur', 'Barisal', 'Mymensingh', 'Gazipur', 'Narayanganj']
+DHAKA_AREAS = ['Gulshan', 'Banani', 'Dhanmondi', 'Niketon', 'Motijheel', 'Kawran Bazar', 'Mohakhali', 'Uttara', 'Mirpur', 'Badda', 'Rampura', 'Tejgaon', 'Farmgate', 'Khilgaon', 'Bandaree']
+REMOTE_KEYWORDS = ['remote', 'work from home', 'wfh']
+
+# Single date parser reused for every deadline, created on first use because
+# importing dateparser loads its locale data (see _get_date_parser)
+_date_parser = None
+
+# Regex patterns are compiled once at import time and reused on every call.
+# Deadline patterns (labeled, from config) and standalone date patterns.
+# They run against the already-lowercased text, so they are compiled
+# case-sensitive, which lets re use its fast literal-prefix search
+_DATE_PATTERNS = [_compile_scanner(pattern) for pattern in config.DATE_PATTERNS]
+_DATE_ONLY_SOURCES = [
+    r'\b(\d{1,2}[\/\-\.]\d{1,2}[\/\-\.]\d{2,4})\b',
+    r'\b(\d{1,2}\s+(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s+\d{4})\b',
+    r'\b((?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s+\d{1,2},?\s+\d{4})\b',
+]
+_DATE_ONLY_PATTERNS = [_compile_scanner(pattern) for pattern in _DATE_ONLY_SOURCES]
+# \b keeps the patterns above on re; without it they run on RE2 and match
+# wherever a real date could start, so they find the first candidate cheaply
+_DATE_ONLY_PREFILTERS = [_compile_scanner(pattern.replace(r'\b', '')) for pattern in _DATE_ONLY_SOURCES]
+
+_COMPANY_PATTERN_SOURCES = [
+    # "Company: Acme Corporation"
+    ('company_label', r'Company:\s*([A-Z][A-Za-z\s&.,()]+?)(?:\n|is|hiring|looking|Job|$)'),
+    
+    # "Organization: Tech Solutions"
+    ('organization_label', r'Organization:\s*([A-Z][A-Za-z\s&.,()]+?)(?:\n|is|Job|$)'),
+    
+    # "About XYZ Limited" or "About Cityscape International Ltd"
+    ('about', r'About\s+(?:Us\s+)?([A-Z][A-Za-z\s&.,()]+?(?:Ltd|Limited|Inc|Corporation|Group|International|Bangladesh))(?:\n|is|Job|$)'),
+    
+    # "Cityscape International Ltd is hiring"
+    # The unlabeled suffix patterns can start at any letter, so their name run
+    # is capped to keep the re fallback from backtracking quadratically
+    ('company_suffix', r'([A-Z][A-Za-z\s&.,()]{1,100}?(?:Ltd|Limited|Inc|Corporation|Group|International))\s+is\s+(?:hiring|looking|seeking)'),
+    
+    # "Join Helium Bangladesh"
+    ('join', r'Join\s+(?:our team at\s+)?([A-Z][A-Za-z\s&.,()]+?(?:Ltd|Limited|Inc|Corporation|Group|International|Bangladesh))(?:\n|!|\.|$)'),
+    
+    # Look for company names ending with common suffixes
+    ('company_suffix', r'([A-Z][A-Za-z\s&.,()]{1,100}?(?:Limited|Ltd|Inc|Corporation|Group|International|Bangladesh))\s*(?:\n|is|hiring|$)'),
+]
+_COMPANY_PATTERNS = [
+    (anchor, _compile_scanner(pattern, re.IGNORECASE | re.MULTILINE))
+    for anchor, pattern in _COMPANY_PATTERN_SOURCES
+]
+_COMPANY_LABELS_RE, _COMPANY_LABEL_INDEXES = _compile_label_union(
+    _COMPANY_PATTERN_SOURCES, ('company_label', 'organization_label'), re.IGNORECASE | re.MULTILINE
+)
+
+_POSITION_PATTERN_SOURCES = [
+    # "Position: Software Engineer"
+    ('position_label', r'Position:\s*([A-Z][A-Za-z\s\-–&/(),]+?)(?:\n|Job|Employment|Work|$)'),
+    
+    # "Job Title: Marketing Manager"
+    ('job_title_label', r'Job Title:\s*([A-Z][A-Za-z\s\-–&/(),]+?)(?:\n|Job|Employment|Work|$)'),
+    
+    # "Role: Data Analyst"
+    ('role_label', r'Role:\s*([A-Z][A-Za-z\s\-–&/(),]+?)(?:\n|Job|Employment|Work|$)'),
+    
+    # "Hiring for: HR Intern"
+    ('hiring_for_label', r'Hiring for:\s*([A-Z][A-Za-z\s\-–&/(),]+?)(?:\n|Job|to|$)'),
+    
+    # "Vacancy: Senior Developer"
+    ('vacancy_label', r'Vacancy:\s*([A-Z][A-Za-z\s\-–&/(),]+?)(?:\n|Job|Employment|$)'),
+    
+    # "is looking for IT & Odoo Software Intern" (from your example) - prioritize this
+    ('is_looking_for', r'is looking for\s+([A-Z][A-Za-z\s\-–&/(),]+?)(?:\n|Job|to|$)'),
+    
+    # "We are looking for a Software Engineer" - check this last
+    ('looking_for', r'looking for\s+(?:a|an)\s+([A-Z][A-Za-z\s\-–&/(),]+?)(?:\n|to|with|who|$)'),
+]
+_POSITION_PATTERNS = [
+    (anchor, _compile_scanner(pattern, re.IGNORECASE | re.MULTILINE))
+    for anchor, pattern in _POSITION_PATTERN_SOURCES
+]
+# "Job Title:" stays separate: "Job" ends the other labels' values, so their
+# matches could swallow it
+_POSITION_LABELS_RE, _POSITION_LABEL_INDEXES = _compile_label_union(
+    _POSITION_PATTERN_SOURCES,
+    ('position_label', 'role_label', 'hiring_for_label', 'vacancy_label'),
+    re.IGNORECASE | re.MULTILINE
+)
+
+# "Location: Police Park, House #05, Road #10, Block D, Bandaree, Khilgaon, Dhaka 1219"
+# Captures the rest of the label's line (see _find_labeled_value)
+_LOCATION_LABELS = ('job location:', 'work location:', 'location:', 'workplace:', 'office:')
+# Used only when lowercasing changes the text length and breaks the line scan
+_LOCATION_LABELED_RE = _compile_scanner(
+    r'(?:Location|Job Location|Workplace|Office|Work Location):\s*([^\n]+)(?:\n\n|\n[A-Z]|$)',
+    re.IGNORECASE | re.MULTILINE
+)
+_LOCATION_PIPE_RE = re.compile(r'\s*\|.*$')
+_LOCATION_METADATA_RE = re.compile(r'\s*\b(Job|Employment|Salary|Deadline)\s*:.*$', re.IGNORECASE)
+_LOCATION_PREFIX_RE = re.compile(r'^(?:at|in|from)\s+', re.IGNORECASE)
+_CITIES_ALTERNATION = '|'.join(BANGLADESH_CITIES)
+# City with surrounding address context (limited to 100 chars before city)
+_LOCATION_CONTEXT_RE = _compile_scanner(
+    f'([A-Za-z\\s,#\\-()0-9]{{0,100}}(?:{_CITIES_ALTERNATION})[A-Za-z\\s,#\\-()0-9]*)',
+    re.IGNORECASE
+)
+_CITY_RE = _compile_scanner(f'((?:{_CITIES_ALTERNATION})(?:\\s*\\d+)?)', re.IGNORECASE)
+_AREA_RE = _compile_scanner(f'((?:{"|".join(DHAKA_AREAS)})(?:\\s*\\d+)?(?:,\\s*Dhaka)?)', re.IGNORECASE)
+_REMOTE_RE = _compile_scanner(f'\\b({"|".join(REMOTE_KEYWORDS)})\\b', re.IGNORECASE)
+
+
+def _build_location_automaton():
+    """
+    Build one Aho-Corasick automaton over city, area and remote keywords.
+    
+    Returns:
+        Automaton mapping each lowercased keyword to (kind, length)
+    """
+    automaton = ahocorasick.Automaton()
+    for kind, keywords in (('city', BANGLADESH_CITIES), ('area', DHAKA_AREAS), ('remote', REMOTE_KEYWORDS)):
+        for keyword in keywords:
+            automaton.add_word(keyword.lower(), (kind, len(keyword)))
+    automaton.make_automaton()
+    return automaton
+
+
+_LOCATION_AUTOMATON = _build_location_automaton() if AHOCORASICK_AVAILABLE else None
+
+# Salary pattern 1: labeled salary with full details
+# "Salary: Tk. 22,000 - 30,000 (Monthly)"
+# "Monthly Salary: BDT 25,000 - 35,000 (Negotiable)"
+_SALARY_LABELS = ('monthly salary:', 'salary:', 'compensation:', 'package:', 'pay:')
+# Used only when lowercasing changes the text length and breaks the line scan
+_SALARY_LABELED_RE = _compile_scanner(
+    r'(?:Salary|Compensation|Monthly Salary|Package|Pay):\s*([^\n]+?)(?:\n\n|\n[A-Z]|$)',
+    re.IGNORECASE | re.MULTILINE
+)
+_SALARY_LABELED_VALID_RE = re.compile(r'\d|negotiable', re.IGNORECASE)
+
+# Salary patterns 2 and 3 fused into one scan: currency symbol at start,
+# or amount first then currency; ranges are tried before single amounts
+# "Tk. 22,000 - 30,000 per month", "৳25k-35k", "Tk 50000+", "BDT 50k per month"
+# "22,000 - 30,000 BDT", "30k-40k BDT/month", "50000+ BDT", "50k Tk per month"
+_SALARY_SUFFIX = r'(?:\s*(?:per month|monthly|/month|\(Monthly\)|\(Negotiable\)))?'
+_SALARY_CURRENCY_RE = _compile_scanner(
+    # Currency + number + (k)? + (separator + number + (k)? + currency? | +)? + optional suffix
+    r'(?P<currency_first>(?:Tk\.?|৳|BDT|USD|\$)\s*[\d,]+(?:k|K)?'
+    r'(?:(?P<currency_range>\s*[-–to]+\s*[\d,]+(?:k|K)?(?:\s*(?:BDT|Tk|৳|USD|\$))?)|\+)?' + _SALARY_SUFFIX + r')'
+    # Number + (k)? + (separator + number + (k)? | +)? + currency + optional suffix;
+    # the amount starts with a digit so a stray comma cannot swallow a currency-first match
+    r'|(?P<amount_first>\d[\d,]*(?:k|K)?(?:(?P<amount_range>\s*[-–to]+\s*[\d,]+(?:k|K)?)|\+)?'
+    r'\s*(?P<amount_currency>BDT|Tk\.?|৳|USD|\$)' + _SALARY_SUFFIX + r')',
+    re.IGNORECASE
+)
+# Kinds of currency matches, most trusted first
+_SALARY_CURRENCY_KINDS = ('currency first range', 'currency first', 'amount first range', 'amount first')
+# Regex answers trusted without asking Ollama: a salary naming its currency
+# and a company name with a legal suffix
+_CONFIDENT_SALARY_RE = re.compile(r'Tk|৳|BDT|USD|\$', re.IGNORECASE)
+_CONFIDENT_COMPANY_RE = re.compile(r'\b(?:Ltd\.?|Limited)$', re.IGNORECASE)
+_DIGIT_RE = re.compile(r'\d')
+_TWO_DIGITS_RE = re.compile(r'\d{2,}')
+
+# Salary pattern 4: just numbers in salary context (no currency symbol)
+# "22,000 - 30,000 (Monthly)"
+# "30000-40000"
+# Only match if near "Salary" keyword to avoid false positives
+_SALARY_CONTEXTUAL_RE = _compile_scanner(
+    r'(?:Salary|Compensation|Pay)(?:[:\s]+).*?([\d,]+\s*(?:[-–to]+)\s*[\d,]+(?:\s*\((?:Monthly|Negotiable|Per Month)\))?)',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Salary pattern 5: "Negotiable" or "As per company policy"
+_SALARY_NEGOTIABLE_RE = _compile_scanner(
+    r'(?:Salary|Compensation)[:\s]+(Negotiable|As per company policy|Competitive)',
+    re.IGNORECASE
+)
+
+# Salary pattern 6: standalone amount ranges (last resort, be conservative)
+# Only match clear salary-like numbers (4-6 digits with separator or k suffix)
+_SALARY_STANDALONE_SOURCE = r'\b((?:\d{2,3}[,]\d{3}|\d{2,3}k)\s*[-–to]+\s*(?:\d{2,3}[,]\d{3}|\d{2,3}k))\b'
+_SALARY_STANDALONE_RE = _compile_scanner(_SALARY_STANDALONE_SOURCE, re.IGNORECASE)
+# RE2 twin without \b that finds where a standalone range could start
+_SALARY_STANDALONE_PREFILTER = _compile_scanner(_SALARY_STANDALONE_SOURCE.replace(r'\b', ''), re.IGNORECASE)
+
+# Literal anchors the patterns above need before they can match at all.
+# They are checked once per text (see _scan_anchors) so each extractor only
+# runs the patterns whose anchor is actually present.
+_ANCHOR_LITERALS = {
+    'company_label': ('Company:',),
+    'organization_label': ('Organization:',),
+    'about': ('About',),
+    'join': ('Join',),
+    'company_suffix': ('Ltd', 'Limited', 'Inc', 'Corporation', 'Group', 'International', 'Bangladesh'),
+    'position_label': ('Position:',),
+    'job_title_label': ('Job Title:',),
+    'role_label': ('Role:',),
+    'hiring_for_label': ('Hiring for:',),
+    'vacancy_label': ('Vacancy:',),
+    'is_looking_for': ('is looking for',),
+    'looking_for': ('looking for',),
+    'location_label': ('Location:', 'Job Location:', 'Workplace:', 'Office:', 'Work Location:'),
+    'salary_label': ('Salary:', 'Compensation:', 'Monthly Salary:', 'Package:', 'Pay:'),
+    'salary_keyword': ('Salary', 'Compensation', 'Pay'),
+    'currency': ('Tk', '৳', 'BDT', 'USD', '$'),
+    # First word of each config.DATE_PATTERNS label
+    'deadline_label': ('deadline', 'apply', 'last', 'close', 'শেষ', 'due', 'expires', 'valid'),
+}
+_ANCHOR_FOLDED = {
+    name: tuple(literal.casefold() for literal in literals)
+    for name, literals in _ANCHOR_LITERALS.items()
+}
+
+
+def _build_anchor_set():
+    """
+    Compile every anchor into one RE2 multi-pattern set, so a single
+    linear scan reports all anchors present in a text.
+    
+    Returns:
+        Compiled re2.Set whose match indexes follow _ANCHOR_NAMES
+    """
+    anchor_set = re2.Set.SearchSet()
+    for name in _ANCHOR_NAMES:
+        anchor_set.Add('(?i)' + '|'.join(re.escape(literal) for literal in _ANCHOR_LITERALS[name]))
+    anchor_set.Compile()
+    return anchor_set
+
+
+_ANCHOR_NAMES = list(_ANCHOR_LITERALS)
+_ANCHOR_SET = _build_anchor_set() if RE2_AVAILABLE else None
+
+
+def _scan_anchors(text: str) -> set:
+    """
+    Find which pattern anchors occur in text. With RE2 this is one
+    multi-pattern scan; otherwise each literal is a plain substring check
+    on the casefolded text.
+    
+    Args:
+        text: Job posting text
+        
+    Returns:
+        Set of anchor names (keys of _ANCHOR_LITERALS) present in text
+    """
+    if _ANCHOR_SET is not None:
+        return {_ANCHOR_NAMES[idx] for idx in _ANCHOR_SET.Match(text) or ()}
+    
+    text_folded = text.casefold()
+    return {
+        name for name, literals in _ANCHOR_FOLDED.items()
+        if any(literal in text_folded for literal in literals)
+    }
+
+
+# Keywords that locate each single-field Ollama pass's answer, strongest
+# group first; see _slice_around.
+# Windowed passes give up the "Job Posting:" prefix the other prompts share
+# (see _extract_all). That prefix only saves work when Ollama still holds
+# the posting in the slot a pass lands on, which concurrent passes on
+# separate slots or an evicted cache lose. A window caps what a pass has to
+# read afresh at WINDOW_BEFORE + WINDOW_AFTER characters. Company, position
+# and description need the whole posting and keep the shared prefix.
+_SALARY_WINDOW_KEYWORDS = (
+    _ANCHOR_LITERALS['salary_label'],
+    _ANCHOR_LITERALS['salary_keyword'] + _ANCHOR_LITERALS['currency'],
+)
+_LOCATION_WINDOW_KEYWORDS = (
+    _ANCHOR_LITERALS['location_label'],
+    tuple(BANGLADESH_CITIES + DHAKA_AREAS + REMOTE_KEYWORDS),
+)
+_DEADLINE_WINDOW_KEYWORDS = (
+    ('deadline', 'apply by', 'apply before', 'last date', 'valid till', 'closes', 'close date', 'শেষ তারিখ'),
+)
+# Characters kept before and after the keyword
+WINDOW_BEFORE = 200
+WINDOW_AFTER = 600
+
+
+def _slice_around(text: str, keyword_groups) -> str:
+    """
+    Cut the part of a posting around the first keyword of the strongest
+    group present, so a single-field Ollama pass reads a short window
+    instead of the whole posting.
+    
+    Args:
+        text: Job posting text
+        keyword_groups: Tuples of keywords, strongest group first
+        
+    Returns:
+        Window of text around the keyword, or the whole text if no
+        keyword occurs
+    """
+    text_folded = text.casefold()
+    # casefold() can change the length, so positions are only usable as-is
+    # when it did not
+    if len(text_folded) != len(text):
+        return text
+    
+    for keywords in keyword_groups:
+        positions = [text_folded.find(keyword.casefold()) for keyword in keywords]
+        positions = [pos for pos in positions if pos >= 0]
+        if positions:
+            start = min(positions)
+            return text[max(0, start - WINDOW_BEFORE):start + WINDOW_AFTER]
+    
+    return text
+
+
+def _get_date_parser():
+    """
+    Get or create the shared date parser.
+    Restricting languages to English and Bengali skips dateparser's
+    per-call language detection.
+    
+    Returns:
+        DateDataParser configured for config.TIMEZONE, preferring future dates
+    """
+    global _date_parser
+    
+    if _date_parser is None:
+        from dateparser.date import DateDataParser
+        _date_parser = DateDataParser(
+            languages=['en', 'bn'],
+            settings={
+                'TIMEZONE': str(config.TIMEZONE),
+                'RETURN_AS_TIMEZONE_AWARE': True,
+                'PREFER_DATES_FROM': 'future'
+            }
+        )
+    
+    return _date_parser
+
+
+def warm_up_date_parser():
+    """
+    Build the shared date parser and run one parse so dateparser loads its
+    language data now rather than during the first posting it handles.
+    """
+    _get_date_parser().get_date_data('15 January 2025')
+    logger.info("Date parser warmed up")
+
+
+def warm_up_ollama():
+    """
+    Load the extraction model into Ollama's memory ahead of the first
+    posting. An empty prompt only loads the model; keep_alive holds it
+    there between postings.
+    """
+    if not OLLAMA_AVAILABLE:
+        return
+    
+    _get_ollama_client().generate(
+        model=config.OLLAMA_MODEL,
+        prompt='',
+        options={'num_ctx': EXTRACTION_CONTEXT},
+        keep_alive=config.OLLAMA_KEEP_ALIVE,
+    )
+    logger.info(f"Ollama model {config.OLLAMA_MODEL} loaded")
+
+
+def _get_ollama_client():
+    """
+    Get or create the Ollama client instance.
+    
+    Returns:
+        Ollama client for config.OLLAMA_HOST
+    """
+    global _ollama_client
+    
+    if _ollama_client is None:
+        _ollama_client = ollama.Client(host=config.OLLAMA_HOST)
+        logger.info(f"Ollama client created for {config.OLLAMA_HOST}")
+    
+    return _ollama_client
+
 
-def extract_deadline_regex(text: str) -> Optional[datetime]:
+# Unambiguous formats parsed with strptime before falling back to dateparser
+# (numeric day/month orders are left to dateparser)
+FAST_DATE_FORMATS = ('%Y-%m-%d', '%d %B %Y', '%d %b %Y', '%B %d, %Y', '%b %d, %Y', '%B %d %Y', '%b %d %Y')
+
+
+def _parse_date_fast(date_str: str) -> Optional[datetime]:
+    """
+    Parse a date in one of FAST_DATE_FORMATS without loading dateparser.
+    
+    Args:
+        date_str: Date text to parse
+        
+    Returns:
+        Midnight of that date in config.TIMEZONE, or None if no format fits
+    """
+    date_str = date_str.strip()
+    if not date_str.isascii():
+        return None
+    
+    for fmt in FAST_DATE_FORMATS:
+        try:
+            return config.TIMEZONE.localize(datetime.strptime(date_str, fmt))
+        except ValueError:
+            continue
+    
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _parse_date_cached(date_str: str, today: date) -> Optional[datetime]:
+    """
+    Parse a date string with the shared date parser, memoized per string and day.
+    
+    Args:
+        date_str: Date text to parse
+        today: Current local date; part of the cache key so relative
+            dates and the future preference never go stale
+        
+    Returns:
+        Timezone-aware datetime or None if unparseable
+    """
+    return _parse_date_fast(date_str) or _get_date_parser().get_date_data(date_str).date_obj
+
+
+def _parse_date(date_str: str) -> Optional[datetime]:
+    """
+    Parse a date string in the configured timezone, preferring future dates.
+    
+    Args:
+        date_str: Date text to parse
+        
+    Returns:
+        Timezone-aware datetime or None if unparseable
+    """
+    return _parse_date_cached(date_str, datetime.now(config.TIMEZONE).date())
+
+
+def extract_deadline_regex(text: str, standalone: bool = True,
+                           anchors: Optional[set] = None) -> Optional[datetime]:
     """
     Extract deadline using regex patterns and dateparser.
     Handles multiple date formats.
     
     Args:
         text: Job posting text
+        standalone: Also accept unlabeled future dates when no labeled
+            deadline is found
+        anchors: Anchors already found by _scan_anchors (optional)
         
     Returns:
         Datetime object or None if not found
     """
     logger.info("Attempting to extract deadline using regex patterns")
     
-    # Convert text to lowercase for case-insensitive matching
-    text_lower = text.lower()
+    text = text[:MAX_DEADLINE_SCAN_LENGTH]
+    
+    # The date patterns are all lowercase
+    text_lower = utils.lowercase(text)
+    
+    # Every date pattern needs a digit
+    if not _DIGIT_RE.search(text_lower):
+        logger.info("No deadline found using regex patterns")
+        return None
+    
+    if anchors is None:
+        anchors = _scan_anchors(text)
     
     # Try each pattern
-    for pattern in config.DATE_PATTERNS:
-        matches = re.findall(pattern, text_lower, re.IGNORECASE)
+    for pattern in (_DATE_PATTERNS if 'deadline_label' in anchors else ()):
+        # Only the first match is tried, so stop scanning there
+        match = pattern.search(text_lower)
         
-        if matches:
-            logger.info(f"Found potential date match: {matches[0]}")
+        if match:
+            date_str = match.group(1)
+            logger.info(f"Found potential date match: {date_str}")
             
             # Parse the date using dateparser
             try:
-                deadline = dateparser.parse(
-                    matches[0],
-                    settings={
-                        'TIMEZONE': str(config.TIMEZONE),
-                        'RETURN_AS_TIMEZONE_AWARE': True,
-                        'PREFER_DATES_FROM': 'future'
-                    }
-                )
+                deadline = _parse_date(date_str)
                 
                 if deadline:
                     logger.info(f"Successfully parsed deadline: {deadline}")
                     return deadline
             except Exception as e:
-                logger.warning(f"Failed to parse date '{matches[0]}': {str(e)}")
+                logger.warning(f"Failed to parse date '{date_str}': {str(e)}")
                 continue
     
+    if not standalone:
+        logger.info("No labeled deadline found using regex patterns")
+        return None
+    
     # Additional attempt: look for standalone dates
     logger.info("Trying to find standalone dates in text")
-    date_only_patterns = [
-        r'\b(\d{1,2}[\/\-\.]\d{1,2}[\/\-\.]\d{2,4})\b',
-        r'\b(\d{1,2}\s+(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s+\d{4})\b',
-        r'\b((?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s+\d{1,2},?\s+\d{4})\b',
-    ]
     
-    for pattern in date_only_patterns:
-        matches = re.findall(pattern, text_lower, re.IGNORECASE)
-        
-        if matches:
-            for match in matches:
-                try:
-                    deadline = dateparser.parse(
-                        match,
-                        settings={
-                            'TIMEZONE': str(config.TIMEZONE),
-                            'RETURN_AS_TIMEZONE_AWARE': True,
-                            'PREFER_DATES_FROM': 'future'
-                        }
-                    )
-                    
-                    if deadline:
-                        # Only accept if date is in the future
-                        now = datetime.now(config.TIMEZONE)
-                        if deadline > now:
-                            logger.info(f"Found future date: {deadline}")
-                            return deadline
-                except Exception as e:
-                    logger.warning(f"Failed to parse standalone date '{match}': {str(e)}")
-                    continue
+    # Read the clock once for every candidate below
+    now = datetime.now(config.TIMEZONE)
+    today = now.date()
+    
+    for pattern, prefilter in zip(_DATE_ONLY_PATTERNS, _DATE_ONLY_PREFILTERS):
+        candidate = prefilter.search(text_lower)
+        if not candidate:
+            continue
+        # No real date can start before the first candidate; matches are
+        # produced lazily since the first future date ends the search
+        for match in pattern.finditer(text_lower, candidate.start()):
+            date_str = match.group(1)
+            try:
+                deadline = _parse_date_cached(date_str, today)
+                
+                if deadline:
+                    # Only accept if date is in the future
+                    if deadline > now:
+                        logger.info(f"Found future date: {deadline}")
+                        return deadline
+            except Exception as e:
+                logger.warning(f"Failed to parse standalone date '{date_str}': {str(e)}")
+                continue
     
     logger.info("No deadline found using regex patterns")
     return None
 
 
-def extract_company_regex(text: str) -> Optional[str]:
+def extract_company_regex(text: str, anchors: Optional[set] = None) -> Optional[str]:
     """
     Extract company name using regex patterns.
     Fallback when Ollama extraction fails.
     
     Args:
         text: Job posting text
+        anchors: Anchors already found by _scan_anchors (optional)
         
     Returns:
         Company name string or None
     """
     logger.info("Attempting to extract company using regex patterns")
     
-    patterns = [
-        # "Company: Acme Corporation"
-        r'Company:\s*([A-Z][A-Za-z\s&.,()]+?)(?:\n|is|hiring|looking|Job|$)',
-        
-        # "Organization: Tech Solutions"
-        r'Organization:\s*([A-Z][A-Za-z\s&.,()]+?)(?:\n|is|Job|$)',
-        
-        # "About XYZ Limited" or "About Cityscape International Ltd"
-        r'About\s+(?:Us\s+)?([A-Z][A-Za-z\s&.,()]+?(?:Ltd|Limited|Inc|Corporation|Group|International|Bangladesh))(?:\n|is|Job|$)',
-        
-        # "Cityscape International Ltd is hiring"
-        r'([A-Z][A-Za-z\s&.,()]+?(?:Ltd|Limited|Inc|Corporation|Group|International))\s+is\s+(?:hiring|looking|seeking)',
-        
-        # "Join Helium Bangladesh"
-        r'Join\s+(?:our team at\s+)?([A-Z][A-Za-z\s&.,()]+?(?:Ltd|Limited|Inc|Corporation|Group|International|Bangladesh))(?:\n|!|\.|$)',
-        
-        # Look for company names ending with common suffixes
-        r'([A-Z][A-Za-z\s&.,()]+?(?:Limited|Ltd|Inc|Corporation|Group|International|Bangladesh))\s*(?:\n|is|hiring|$)',
-    ]
+    if anchors is None:
+        anchors = _scan_anchors(text)
     
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
-        if match:
-            company = match.group(1).strip()
+    label_values = None
+    for idx, (anchor, pattern) in enumerate(_COMPANY_PATTERNS):
+        if anchor and anchor not in anchors:
+            continue
+        if idx in _COMPANY_LABEL_INDEXES:
+            # All "Label:" patterns are found by one shared scan
+            if label_values is None:
+                label_values = _first_label_values(_COMPANY_LABELS_RE, text)
+            company = label_values.get(idx)
+        else:
+            # Unlabeled phrasings ("About ...", "... Ltd is hiring") can
+            # appear anywhere, so only labels are limited to the top
+            match = _search_labeled(pattern, text) if anchor.endswith('_label') else pattern.search(text)
+            company = match.group(1) if match else None
+        if company:
+            company = company.strip()
             # Clean up
-            company = re.sub(r'\s+', ' ', company)  # Normalize whitespace
+            company = ' '.join(company.split())  # Normalize whitespace
             # Sanity check: reasonable length
             if 3 < len(company) < 100 and company.lower() not in ['job', 'position', 'role']:
                 logger.info(f"Regex extracted company: {company}")
@@ -157,48 +817,46 @@ def extract_company_regex(text: str) -> Optional[str]:
     return None
 
 
-def extract_position_regex(text: str) -> Optional[str]:
+def extract_position_regex(text: str, anchors: Optional[set] = None,
+                           labeled_only: bool = False) -> Optional[str]:
     """
     Extract job position/title using regex patterns.
     Fallback when Ollama extraction fails.
     
     Args:
         text: Job posting text
+        anchors: Anchors already found by _scan_anchors (optional)
+        labeled_only: Only accept titles after a label like "Position:",
+            skipping the "looking for ..." phrasings
         
     Returns:
         Position string or None
     """
     logger.info("Attempting to extract position using regex patterns")
     
-    patterns = [
-        # "Position: Software Engineer"
-        r'Position:\s*([A-Z][A-Za-z\s\-–&/(),]+?)(?:\n|Job|Employment|Work|$)',
-        
-        # "Job Title: Marketing Manager"
-        r'Job Title:\s*([A-Z][A-Za-z\s\-–&/(),]+?)(?:\n|Job|Employment|Work|$)',
-        
-        # "Role: Data Analyst"
-        r'Role:\s*([A-Z][A-Za-z\s\-–&/(),]+?)(?:\n|Job|Employment|Work|$)',
-        
-        # "Hiring for: HR Intern"
-        r'Hiring for:\s*([A-Z][A-Za-z\s\-–&/(),]+?)(?:\n|Job|to|$)',
-        
-        # "Vacancy: Senior Developer"
-        r'Vacancy:\s*([A-Z][A-Za-z\s\-–&/(),]+?)(?:\n|Job|Employment|$)',
-        
-        # "is looking for IT & Odoo Software Intern" (from your example) - prioritize this
-        r'is looking for\s+([A-Z][A-Za-z\s\-–&/(),]+?)(?:\n|Job|to|$)',
-        
-        # "We are looking for a Software Engineer" - check this last
-        r'looking for\s+(?:a|an)\s+([A-Z][A-Za-z\s\-–&/(),]+?)(?:\n|to|with|who|$)',
-    ]
+    if anchors is None:
+        anchors = _scan_anchors(text)
     
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
-        if match:
-            position = match.group(1).strip()
+    label_values = None
+    for idx, (anchor, pattern) in enumerate(_POSITION_PATTERNS):
+        if labeled_only and not anchor.endswith('_label'):
+            break
+        if anchor and anchor not in anchors:
+            continue
+        if idx in _POSITION_LABEL_INDEXES:
+            # All "Label:" patterns are found by one shared scan
+            if label_values is None:
+                label_values = _first_label_values(_POSITION_LABELS_RE, text)
+            position = label_values.get(idx)
+        else:
+            # Unlabeled phrasings ("looking for ...") can appear anywhere,
+            # so only labels are limited to the top
+            match = _search_labeled(pattern, text) if anchor.endswith('_label') else pattern.search(text)
+            position = match.group(1) if match else None
+        if position:
+            position = position.strip()
             # Clean up
-            position = re.sub(r'\s+', ' ', position)
+            position = ' '.join(position.split())
             # Sanity check
             if 3 < len(position) < 150:
                 logger.info(f"Regex extracted position: {position}")
@@ -208,84 +866,178 @@ def extract_position_regex(text: str) -> Optional[str]:
     return None
 
 
-def extract_location_regex(text: str) -> Optional[str]:
+def _is_word_char(char: str) -> bool:
+    """Match the definition of a word character used by re's \\b."""
+    return char.isalnum() or char == '_'
+
+
+def _find_location_keywords(text: str) -> Dict[str, int]:
+    """
+    Find where the first city and area names start and whether a remote
+    keyword occurs, in a single pass over the text.
+    
+    Args:
+        text: Job posting text
+        
+    Returns:
+        Dictionary mapping 'city'/'area'/'remote' to the start index of
+        their leftmost match; missing kinds were not found
+    """
+    text_lower = utils.lowercase(text)
+    
+    # Lowercasing a few Unicode characters changes the string length, which
+    # would break index mapping, so those texts use the regex patterns
+    if _LOCATION_AUTOMATON is None or len(text_lower) != len(text):
+        found = {}
+        for kind, pattern in (('city', _CITY_RE), ('area', _AREA_RE), ('remote', _REMOTE_RE)):
+            match = pattern.search(text)
+            if match:
+                found[kind] = match.start()
+        return found
+    
+    found = {}
+    for end_idx, (kind, length) in _LOCATION_AUTOMATON.iter(text_lower):
+        start = end_idx - length + 1
+        # Remote keywords must be whole words, like the \b in _REMOTE_RE
+        if kind == 'remote' and (
+            (start > 0 and _is_word_char(text[start - 1])) or
+            (end_idx + 1 < len(text) and _is_word_char(text[end_idx + 1]))
+        ):
+            continue
+        if kind not in found or start < found[kind]:
+            found[kind] = start
+    return found
+
+
+# Rest of the first line holding a non-space character, for a label whose
+# value sits on a later line
+_NEXT_LINE_VALUE_RE = re.compile(r'\S[^\n]*')
+
+
+def _find_labeled_value(text: str, labels, labeled_re) -> Optional[str]:
+    """
+    Find the value after the first label ("Salary:", "Location:", ...)
+    by scanning lines with plain string search instead of a regex.
+    A label at the end of a line takes its value from the next non-blank line.
+    Labels must start in the first LABELED_SEARCH_LENGTH characters; their
+    values may run past it.
+    
+    Args:
+        text: Job posting text
+        labels: Lowercase labels; any two that overlap must end at the same colon
+        labeled_re: Equivalent regex capturing the value in group 1
+        
+    Returns:
+        Stripped value or None if no label is found
+    """
+    # The window runs to the end of the line the limit falls in, so a
+    # label near the limit keeps its whole value
+    window_end = text.find('\n', LABELED_SEARCH_LENGTH)
+    if window_end < 0:
+        window_end = len(text)
+    window = text[:window_end]
+    text_lower = utils.lowercase(text)
+    # Slicing the shared lowercase text matches lowering the window whenever
+    # lowering kept every character's position
+    window_lower = text_lower[:window_end] if len(text_lower) == len(text) else window.lower()
+    
+    # Lowercasing a few Unicode characters changes the string length, which
+    # would break index mapping, so those texts use the regex pattern
+    if len(window_lower) != len(window):
+        match = _search_labeled(labeled_re, text)
+        return match.group(1).strip() if match else None
+    
+    lines = window.split('\n')
+    line_start = 0
+    for line_idx, line_lower in enumerate(window_lower.split('\n')):
+        # Only labels starting before the limit count
+        limit = LABELED_SEARCH_LENGTH - line_start
+        label_ends = []
+        for label in labels:
+            label_start = line_lower.find(label)
+            if 0 <= label_start < limit:
+                label_ends.append(label_start + len(label))
+        line_end = line_start + len(line_lower)
+        line_start = line_end + 1
+        if not label_ends:
+            continue
+        # Overlapping labels ("job location:"/"location:") end at the same
+        # colon, so the smallest end belongs to the leftmost label
+        value = lines[line_idx][min(label_ends):].strip()
+        if value:
+            return value
+        # The next non-blank line may lie past the window, so it is looked
+        # up in the whole text
+        match = _NEXT_LINE_VALUE_RE.search(text, line_end)
+        return match.group().strip() if match else None
+    return None
+
+
+def extract_location_regex(text: str, anchors: Optional[set] = None) -> Optional[str]:
     """
     Extract job location using regex patterns.
     Fallback when Ollama extraction fails.
     
     Args:
         text: Job posting text
+        anchors: Anchors already found by _scan_anchors (optional)
         
     Returns:
         Location string or None
     """
     logger.info("Attempting to extract location using regex patterns")
     
-    # Bangladesh cities for consistent pattern matching
-    BANGLADESH_CITIES = ['Dhaka', 'Chittagong', 'Sylhet', 'Khulna', 'Rajshahi', 'Rangpur', 'Barisal', 'Mymensingh', 'Gazipur', 'Narayanganj']
-    cities_pattern = '|'.join(BANGLADESH_CITIES)
+    if anchors is None:
+        anchors = _scan_anchors(text)
     
     # First try labeled locations (captures full address)
-    labeled_patterns = [
-        # "Location: Police Park, House #05, Road #10, Block D, Bandaree, Khilgaon, Dhaka 1219"
-        # Captures everything until double newline, or newline followed by capital letter, or end of text
-        # Using greedy matching (no ?) to capture the full line
-        r'(?:Location|Job Location|Workplace|Office|Work Location):\s*([^\n]+)(?:\n\n|\n[A-Z]|$)',
-        
-        # Try simpler version if above doesn't work - captures until end of line
-        r'(?:Location|Job Location|Workplace|Office|Work Location):\s*(.+?)(?:\n|$)',
-    ]
+    location = _find_labeled_value(text, _LOCATION_LABELS, _LOCATION_LABELED_RE) if 'location_label' in anchors else None
+    if location:
+        # Clean up
+        location = ' '.join(location.split())  # Normalize whitespace
+        # Remove pipe-separated trailing content
+        location = _LOCATION_PIPE_RE.sub('', location)
+        # Only remove keywords if they look like metadata (followed by colon or are standalone at end)
+        # This prevents removing legitimate place names like "Employment Plaza"
+        location = _LOCATION_METADATA_RE.sub('', location)
+        
+        # Sanity check - must contain at least some text
+        if 3 < len(location) < 200:
+            logger.info(f"Regex extracted location (labeled): {location}")
+            return location
     
-    for pattern in labeled_patterns:
-        match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
-        if match:
-            location = match.group(1).strip()
-            # Clean up
-            location = re.sub(r'\s+', ' ', location)  # Normalize whitespace
-            # Remove pipe-separated trailing content
-            location = re.sub(r'\s*\|.*$', '', location)
-            # Only remove keywords if they look like metadata (followed by colon or are standalone at end)
-            # This prevents removing legitimate place names like "Employment Plaza"
-            location = re.sub(r'\s*\b(Job|Employment|Salary|Deadline)\s*:.*$', '', location, flags=re.IGNORECASE)
-            
-            # Sanity check - must contain at least some text
-            if 3 < len(location) < 200:
-                logger.info(f"Regex extracted location (labeled): {location}")
-                return location
+    keywords = _find_location_keywords(text)
     
     # If labeled pattern fails, try to find city + surrounding context (limited to 100 chars before city)
     # Look for "Dhaka" with surrounding text (address components before and after)
-    context_pattern = f'([A-Za-z\\s,#\\-()0-9]{{0,100}}(?:{cities_pattern})[A-Za-z\\s,#\\-()0-9]*)'
-    match = re.search(context_pattern, text, re.IGNORECASE)
+    # The context reaches at most 100 characters back from the first city,
+    # so the scan can start there instead of at the top of the posting
+    match = _LOCATION_CONTEXT_RE.search(text, max(0, keywords['city'] - 100)) if 'city' in keywords else None
     if match:
         location = match.group(1).strip()
         # Clean up extra whitespace and normalize
-        location = re.sub(r'\s+', ' ', location)
+        location = ' '.join(location.split())
         # Remove common prefixes like "at", "in", "from"
-        location = re.sub(r'^(?:at|in|from)\s+', '', location, flags=re.IGNORECASE)
+        location = _LOCATION_PREFIX_RE.sub('', location)
         
         if 3 < len(location) < 200:
             logger.info(f"Regex extracted location (with context): {location}")
             return location
     
     # Fallback: Try to find just Bangladesh cities
-    city_pattern = f'((?:{cities_pattern})(?:\\s*\\d+)?)'
-    match = re.search(city_pattern, text, re.IGNORECASE)
-    if match:
-        city = match.group(1).strip()
+    if 'city' in keywords:
+        city = _CITY_RE.match(text, keywords['city']).group(1).strip()
         logger.info(f"Regex extracted location (city only): {city}")
         return city
     
     # Try to find Dhaka areas
-    area_pattern = r'((?:Gulshan|Banani|Dhanmondi|Niketon|Motijheel|Kawran Bazar|Mohakhali|Uttara|Mirpur|Badda|Rampura|Tejgaon|Farmgate|Khilgaon|Bandaree)(?:\s*\d+)?(?:,\s*Dhaka)?)'
-    match = re.search(area_pattern, text, re.IGNORECASE)
-    if match:
-        area = match.group(1).strip()
+    if 'area' in keywords:
+        area = _AREA_RE.match(text, keywords['area']).group(1).strip()
         logger.info(f"Regex extracted location (area): {area}")
         return area
     
     # Check for remote work
-    if re.search(r'\b(remote|work from home|wfh)\b', text, re.IGNORECASE):
+    if 'remote' in keywords:
         logger.info("Regex extracted location: Remote")
         return "Remote"
     
@@ -293,7 +1045,29 @@ def extract_location_regex(text: str) -> Optional[str]:
     return None
 
 
-def extract_salary_regex(text: str) -> Optional[str]:
+def _iter_currency_salaries(text: str):
+    """
+    Yield currency-first and amount-first salary matches from one scan.
+    
+    Args:
+        text: Job posting text
+        
+    Yields:
+        Matches of _SALARY_CURRENCY_RE in text order
+    """
+    for match in _SALARY_CURRENCY_RE.finditer(text):
+        yield match
+        if match.group('amount_first'):
+            # The amount's currency may also start a currency-first match
+            # ("Road 10, Tk 25,000"), which finditer skips as overlapping.
+            # RE2 match objects only accept group numbers in start()
+            currency_start = match.start(_SALARY_CURRENCY_RE.groupindex['amount_currency'])
+            currency_match = _SALARY_CURRENCY_RE.match(text, currency_start)
+            if currency_match:
+                yield currency_match
+
+
+def extract_salary_regex(text: str, anchors: Optional[set] = None) -> Optional[str]:
     """
     Extract salary information using regex patterns.
     Fallback when Ollama extraction fails.
@@ -301,110 +1075,77 @@ def extract_salary_regex(text: str) -> Optional[str]:
     
     Args:
         text: Job posting text
+        anchors: Anchors already found by _scan_anchors (optional)
         
     Returns:
         Salary string or None
     """
     logger.info("Attempting to extract salary using regex patterns")
     
-    # Pattern 1: Labeled salary with full details
-    # "Salary: Tk. 22,000 - 30,000 (Monthly)"
-    # "Monthly Salary: BDT 25,000 - 35,000 (Negotiable)"
-    labeled_patterns = [
-        r'(?:Salary|Compensation|Monthly Salary|Package|Pay):\s*([^\n]+?)(?:\n\n|\n[A-Z]|$)',
-    ]
-    
-    for pattern in labeled_patterns:
-        match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
-        if match:
-            salary = match.group(1).strip()
-            # Clean up
-            salary = re.sub(r'\s+', ' ', salary)
-            # Basic validation: contains number or "Negotiable"
-            if re.search(r'\d|negotiable', salary, re.IGNORECASE) and len(salary) < MAX_SALARY_TEXT_LENGTH:
-                logger.info(f"Regex extracted salary (labeled): {salary}")
-                return salary
-    
-    # Pattern 2: Currency symbol at start with range and suffix
-    # "Tk. 22,000 - 30,000 per month"
-    # "৳ 25,000 - 32,000"
-    # "BDT 50,000-60,000 (Monthly)"
-    # "$800-1000/month"
-    currency_first_patterns = [
-        # Range: Currency + number + (k)? + separator + number + (k)? + optional suffix
-        # Examples: "Tk. 22,000 - 30,000 per month", "৳25k-35k"
-        r'((?:Tk\.?|৳|BDT|USD|\$)\s*[\d,]+(?:k|K)?\s*(?:[-–to]+)\s*[\d,]+(?:k|K)?(?:\s*(?:BDT|Tk|৳|USD|\$))?(?:\s*(?:per month|monthly|/month|\(Monthly\)|\(Negotiable\)))?)',
-        
-        # Single amount: Currency + number + (k)? + (+)? + optional suffix
-        # Examples: "Tk 50000+", "BDT 50k per month"
-        r'((?:Tk\.?|৳|BDT|USD|\$)\s*[\d,]+(?:k|K)?(?:\+)?(?:\s*(?:per month|monthly|/month|\(Monthly\)|\(Negotiable\)))?)',
-    ]
+    if anchors is None:
+        anchors = _scan_anchors(text)
     
-    for pattern in currency_first_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            salary = match.group(1).strip()
-            # Clean up whitespace
-            salary = re.sub(r'\s+', ' ', salary)
-            # Validate: reasonable length and contains digits
-            if re.search(r'\d', salary) and 3 < len(salary) < MAX_SALARY_TEXT_LENGTH:
-                logger.info(f"Regex extracted salary (currency first): {salary}")
-                return salary
-    
-    # Pattern 3: Amount first, then currency
-    # "22,000 - 30,000 BDT"
-    # "25000-35000 Tk"
-    # "30k-40k BDT/month"
-    amount_first_patterns = [
-        # Range: number + (k)? + separator + number + (k)? + currency + optional suffix
-        # Examples: "22,000 - 30,000 BDT", "30k-40k BDT/month"
-        r'([\d,]+(?:k|K)?\s*(?:[-–to]+)\s*[\d,]+(?:k|K)?\s*(?:BDT|Tk\.?|৳|USD|\$)(?:\s*(?:per month|monthly|/month|\(Monthly\)|\(Negotiable\)))?)',
-        
-        # Single amount: number + (k)? + (+)? + currency + optional suffix
-        # Examples: "50000+ BDT", "50k Tk per month"
-        r'([\d,]+(?:k|K)?(?:\+)?\s*(?:BDT|Tk\.?|৳|USD|\$)(?:\s*(?:per month|monthly|/month|\(Monthly\)|\(Negotiable\)))?)',
-    ]
+    # Pattern 1: Labeled salary with full details
+    salary = _find_labeled_value(text, _SALARY_LABELS, _SALARY_LABELED_RE) if 'salary_label' in anchors else None
+    if salary:
+        # Clean up
+        salary = ' '.join(salary.split())
+        # Basic validation: contains number or "Negotiable"
+        if _SALARY_LABELED_VALID_RE.search(salary) and len(salary) < MAX_SALARY_TEXT_LENGTH:
+            logger.info(f"Regex extracted salary (labeled): {salary}")
+            return salary
     
-    for pattern in amount_first_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            salary = match.group(1).strip()
-            salary = re.sub(r'\s+', ' ', salary)
+    # Patterns 2 and 3: Currency symbol first or amount first. One scan
+    # collects the first valid match of each kind, then the most trusted wins
+    found = {}
+    for match in _iter_currency_salaries(text) if 'currency' in anchors else []:
+        salary = match.group('currency_first') or match.group('amount_first')
+        if match.group('currency_first'):
+            kind = 'currency first range' if match.group('currency_range') else 'currency first'
+            digits_re = _DIGIT_RE
+        else:
+            kind = 'amount first range' if match.group('amount_range') else 'amount first'
             # Additional validation: must have reasonable digits
-            if re.search(r'\d{2,}', salary) and 3 < len(salary) < MAX_SALARY_TEXT_LENGTH:
-                logger.info(f"Regex extracted salary (amount first): {salary}")
-                return salary
+            digits_re = _TWO_DIGITS_RE
+        if kind in found:
+            continue
+        # Clean up whitespace
+        salary = ' '.join(salary.split())
+        # Validate: reasonable length and contains digits
+        if digits_re.search(salary) and 3 < len(salary) < MAX_SALARY_TEXT_LENGTH:
+            found[kind] = salary
+            if kind == _SALARY_CURRENCY_KINDS[0]:
+                break
+    for kind in _SALARY_CURRENCY_KINDS:
+        if kind in found:
+            logger.info(f"Regex extracted salary ({kind}): {found[kind]}")
+            return found[kind]
     
     # Pattern 4: Just numbers in salary context (no currency symbol)
-    # "22,000 - 30,000 (Monthly)"
-    # "30000-40000"
-    # Only match if near "Salary" keyword to avoid false positives
-    contextual_pattern = r'(?:Salary|Compensation|Pay)(?:[:\s]+).*?([\d,]+\s*(?:[-–to]+)\s*[\d,]+(?:\s*\((?:Monthly|Negotiable|Per Month)\))?)'
-    match = re.search(contextual_pattern, text, re.IGNORECASE | re.DOTALL)
+    match = _SALARY_CONTEXTUAL_RE.search(text) if 'salary_keyword' in anchors else None
     if match:
         # Make sure we don't capture too much text
         potential_salary = match.group(1).strip()
         # Check if captured text is reasonably sized
         if len(potential_salary) < 100:
             salary = potential_salary
-            salary = re.sub(r'\s+', ' ', salary)
+            salary = ' '.join(salary.split())
             logger.info(f"Regex extracted salary (contextual): {salary}")
             return salary
     
     # Pattern 5: "Negotiable" or "As per company policy"
-    negotiable_match = re.search(r'(?:Salary|Compensation)[:\s]+(Negotiable|As per company policy|Competitive)', text, re.IGNORECASE)
+    negotiable_match = _SALARY_NEGOTIABLE_RE.search(text) if 'salary_keyword' in anchors else None
     if negotiable_match:
         logger.info(f"Regex extracted salary (negotiable): {negotiable_match.group(1)}")
         return negotiable_match.group(1)
     
     # Pattern 6: Standalone amount ranges (last resort, be conservative)
-    # Only match clear salary-like numbers (4-6 digits with separator or k suffix)
-    standalone_pattern = r'\b((?:\d{2,3}[,]\d{3}|\d{2,3}k)\s*[-–to]+\s*(?:\d{2,3}[,]\d{3}|\d{2,3}k))\b'
-    match = re.search(standalone_pattern, text, re.IGNORECASE)
+    candidate = _SALARY_STANDALONE_PREFILTER.search(text)
+    match = _SALARY_STANDALONE_RE.search(text, candidate.start()) if candidate else None
     if match:
         salary = match.group(1).strip()
         # Only accept if it looks like a salary (20k-50k range or 20,000-50,000)
-        salary = re.sub(r'\s+', ' ', salary)
+        salary = ' '.join(salary.split())
         logger.info(f"Regex extracted salary (standalone): {salary}")
         return salary
     
@@ -412,14 +1153,35 @@ def extract_salary_regex(text: str) -> Optional[str]:
     return None
 
 
+def extract_fields_regex(text: str) -> Dict:
+    """
+    Run every regex extractor over a posting, sharing one anchor scan.
+    
+    Args:
+        text: Job posting text
+        
+    Returns:
+        Dictionary with company, position, location, salary and deadline
+        (each None if not found)
+    """
+    anchors = _scan_anchors(text)
+    
+    return {
+        'company': extract_company_regex(text, anchors),
+        'position': extract_position_regex(text, anchors),
+        'location': extract_location_regex(text, anchors),
+        'salary': extract_salary_regex(text, anchors),
+        'deadline': extract_deadline_regex(text, anchors=anchors),
+    }
+
+
 def _extract_company(text: str) -> str:
     """Extract company name using Ollama."""
-    prompt = f"""
-Look at this job posting and extract ONLY the company name.
-
-Job Posting:
+    prompt = f"""Job Posting:
 {text}
 
+Look at the job posting above and extract ONLY the company name.
+
 Instructions:
 - Look for company name at the top, in headers, or near "Company:", "Organization:", "Join", "About us:"
 - Check email addresses (e.g., hr@companyname.com means company is "CompanyName")
@@ -435,12 +1197,14 @@ Examples:
 Company name:"""
     
     try:
-        response = ollama.generate(
+        response = _get_ollama_client().generate(
             model=config.OLLAMA_MODEL,
             prompt=prompt,
+            keep_alive=config.OLLAMA_KEEP_ALIVE,
             options={
                 'temperature': 0.1,  # Low temperature for factual extraction
                 'num_predict': 50,   # Limit response length
+                'num_ctx': EXTRACTION_CONTEXT,
             }
         )
         result = response['response'].strip()
@@ -459,12 +1223,11 @@ Company name:"""
 
 def _extract_position(text: str) -> str:
     """Extract job position using Ollama."""
-    prompt = f"""
-Look at this job posting and extract ONLY the job title/position.
-
-Job Posting:
+    prompt = f"""Job Posting:
 {text}
 
+Look at the job posting above and extract ONLY the job title/position.
+
 Instructions:
 - Look for "Job Title:", "Position:", "Role:", "Vacancy:", "Hiring for:", "We are looking for"
 - Usually appears at the very top or in the first few lines
@@ -479,12 +1242,14 @@ Examples:
 Job title:"""
     
     try:
-        response = ollama.generate(
+        response = _get_ollama_client().generate(
             model=config.OLLAMA_MODEL,
             prompt=prompt,
+            keep_alive=config.OLLAMA_KEEP_ALIVE,
             options={
                 'temperature': 0.1,
                 'num_predict': 50,
+                'num_ctx': EXTRACTION_CONTEXT,
             }
         )
         result = response['response'].strip()
@@ -502,12 +1267,12 @@ Job title:"""
 
 def _extract_location(text: str) -> str:
     """Extract location using Ollama."""
-    prompt = f"""
-Look at this job posting and extract ONLY the work location.
-
-Job Posting:
+    text = _slice_around(text, _LOCATION_WINDOW_KEYWORDS)
+    prompt = f"""Job Posting:
 {text}
 
+Look at the job posting above and extract ONLY the work location.
+
 Instructions:
 - Look for "Location:", "Office:", "Workplace:", "Job Location:", "Work from"
 - Look for city names like Dhaka, Chittagong, Sylhet, Khulna, etc.
@@ -526,12 +1291,14 @@ Examples:
 Location:"""
     
     try:
-        response = ollama.generate(
+        response = _get_ollama_client().generate(
             model=config.OLLAMA_MODEL,
             prompt=prompt,
+            keep_alive=config.OLLAMA_KEEP_ALIVE,
             options={
                 'temperature': 0.1,
                 'num_predict': 100,
+                'num_ctx': EXTRACTION_CONTEXT,
             }
         )
         result = response['response'].strip()
@@ -549,12 +1316,12 @@ Location:"""
 
 def _extract_salary(text: str) -> str:
     """Extract salary using Ollama."""
-    prompt = f"""
-Look at this job posting and extract ONLY the salary information.
-
-Job Posting:
+    text = _slice_around(text, _SALARY_WINDOW_KEYWORDS)
+    prompt = f"""Job Posting:
 {text}
 
+Look at the job posting above and extract ONLY the salary information.
+
 Instructions:
 - Look for "Salary:", "Compensation:", "Pay:", "Monthly Salary:", "Package:"
 - Look for currency symbols: BDT, USD, $, ৳, Tk, Tk. (note: Tk. includes the period)
@@ -575,12 +1342,14 @@ Examples:
 Salary:"""
     
     try:
-        response = ollama.generate(
+        response = _get_ollama_client().generate(
             model=config.OLLAMA_MODEL,
             prompt=prompt,
+            keep_alive=config.OLLAMA_KEEP_ALIVE,
             options={
                 'temperature': 0.1,
                 'num_predict': 50,
+                'num_ctx': EXTRACTION_CONTEXT,
             }
         )
         result = response['response'].strip()
@@ -598,12 +1367,12 @@ Salary:"""
 
 def _extract_deadline(text: str) -> str:
     """Extract deadline using Ollama."""
-    prompt = f"""
-Look at this job posting and extract ONLY the application deadline date.
-
-Job Posting:
+    text = _slice_around(text, _DEADLINE_WINDOW_KEYWORDS)
+    prompt = f"""Job Posting:
 {text}
 
+Look at the job posting above and extract ONLY the application deadline date.
+
 Instructions:
 - Look for "Deadline:", "Apply by:", "Last date:", "Applications close:", "Valid till:"
 - Return the date in YYYY-MM-DD format if possible
@@ -617,12 +1386,14 @@ Examples:
 Deadline (YYYY-MM-DD):"""
     
     try:
-        response = ollama.generate(
+        response = _get_ollama_client().generate(
             model=config.OLLAMA_MODEL,
             prompt=prompt,
+            keep_alive=config.OLLAMA_KEEP_ALIVE,
             options={
                 'temperature': 0.1,
                 'num_predict': 30,
+                'num_ctx': EXTRACTION_CONTEXT,
             }
         )
         result = response['response'].strip()
@@ -640,12 +1411,11 @@ Deadline (YYYY-MM-DD):"""
 
 def _extract_description(text: str) -> str:
     """Extract brief job description using Ollama."""
-    prompt = f"""
-Look at this job posting and write a ONE sentence summary (max 200 characters).
-
-Job Posting:
+    prompt = f"""Job Posting:
 {text}
 
+Look at the job posting above and write a ONE sentence summary (max 200 characters).
+
 Instructions:
 - Summarize what the job is about in 1 sentence
 - Focus on key responsibilities or role
@@ -655,12 +1425,14 @@ Instructions:
 Summary:"""
     
     try:
-        response = ollama.generate(
+        response = _get_ollama_client().generate(
             model=config.OLLAMA_MODEL,
             prompt=prompt,
+            keep_alive=config.OLLAMA_KEEP_ALIVE,
             options={
                 'temperature': 0.3,
                 'num_predict': 100,
+                'num_ctx': EXTRACTION_CONTEXT,
             }
         )
         result = response['response'].strip()
@@ -680,6 +1452,173 @@ Summary:"""
         return None
 
 
+def _clean_llm_value(value, max_length: int) -> Optional[str]:
+    """
+    Normalize one field value returned by Ollama.
+    
+    Args:
+        value: Raw value from the model response
+        max_length: Longest value accepted as a real answer
+        
+    Returns:
+        Stripped string or None if missing, "null" or too long
+    """
+    if value is None:
+        return None
+    result = str(value).strip()
+    if result.lower() == 'null' or not result or len(result) > max_length:
+        return None
+    return result
+
+
+def _extraction_schema(fields) -> Dict:
+    """
+    Build the structured output schema for the combined extraction.
+    Ollama constrains generation to it, so the prompt needs no format instructions.
+    
+    Args:
+        fields: Field names to request
+        
+    Returns:
+        JSON schema with each field as a required string or null
+    """
+    return {
+        'type': 'object',
+        'properties': {field: {'type': ['string', 'null']} for field in fields},
+        'required': list(fields),
+    }
+
+
+def _clean_llm_fields(data: Dict, fields) -> Dict:
+    """
+    Normalize the field values of one JSON object returned by Ollama.
+    
+    Args:
+        data: Parsed JSON object
+        fields: Field names to read
+        
+    Returns:
+        Dictionary with a cleaned value or None per field
+    """
+    results = {
+        field: _clean_llm_value(data.get(field), EXTRACTION_FIELDS[field][1])
+        for field in fields
+    }
+    
+    # Truncate if too long
+    if results.get('description') and len(results['description']) > 200:
+        results['description'] = results['description'][:197] + "..."
+    
+    return results
+
+
+def _extract_all(text: str, fields=tuple(EXTRACTION_FIELDS)) -> Optional[Dict]:
+    """
+    Extract job fields with a single Ollama JSON request.
+    
+    Args:
+        text: Job posting text
+        fields: Field names to request (defaults to all of EXTRACTION_FIELDS)
+        
+    Returns:
+        Dictionary with a cleaned value or None per requested field,
+        or None if the response is unusable
+    """
+    field_lines = '\n'.join(f"- {field}: {EXTRACTION_FIELDS[field][0]}" for field in fields)
+    prompt = f"""Job Posting:
+{text}
+
+Look at the job posting above and extract the job details.
+
+Fields:
+{field_lines}
+
+Use null for any field you cannot find."""
+    
+    try:
+        response = _get_ollama_client().generate(
+            model=config.OLLAMA_MODEL,
+            prompt=prompt,
+            keep_alive=config.OLLAMA_KEEP_ALIVE,
+            format=_extraction_schema(fields),
+            options={
+                'temperature': 0.1,
+                'num_predict': 512,
+                'num_ctx': EXTRACTION_CONTEXT,
+            }
+        )
+        data = json.loads(response['response'])
+        if not isinstance(data, dict):
+            logger.info("Combined extraction did not return a JSON object")
+            return None
+        
+        results = _clean_llm_fields(data, fields)
+        logger.info(f"Extracted fields: {results}")
+        return results
+    except Exception as e:
+        logger.error(f"Combined extraction failed: {e}")
+        return None
+
+
+def _extract_batch(texts: List[str]) -> Optional[List]:
+    """
+    Extract all job fields for several postings with a single Ollama JSON request.
+    
+    Args:
+        texts: Job posting texts, already limited in length
+        
+    Returns:
+        List with one raw JSON entry per posting (entries may be malformed),
+        or None if the response is unusable
+    """
+    field_lines = '\n'.join(f"- {field}: {hint}" for field, (hint, _) in EXTRACTION_FIELDS.items())
+    postings = '\n\n'.join(f"Job Posting {idx}:\n{text}" for idx, text in enumerate(texts, 1))
+    prompt = f"""
+Look at these {len(texts)} job postings and extract the job details of each one.
+
+{postings}
+
+Fields for each posting:
+{field_lines}
+
+Return one entry per posting in "jobs", in the same order. Use null for any field you cannot find."""
+    
+    schema = {
+        'type': 'object',
+        'properties': {
+            'jobs': {
+                'type': 'array',
+                'items': _extraction_schema(tuple(EXTRACTION_FIELDS)),
+                'minItems': len(texts),
+                'maxItems': len(texts),
+            }
+        },
+        'required': ['jobs'],
+    }
+    
+    try:
+        response = _get_ollama_client().generate(
+            model=config.OLLAMA_MODEL,
+            prompt=prompt,
+            keep_alive=config.OLLAMA_KEEP_ALIVE,
+            format=schema,
+            options={
+                'temperature': 0.1,
+                'num_predict': 512 * len(texts),
+                'num_ctx': EXTRACTION_BATCH_CONTEXT,
+            }
+        )
+        data = json.loads(response['response'])
+        jobs = data.get('jobs') if isinstance(data, dict) else None
+        if not isinstance(jobs, list):
+            logger.info("Batch extraction did not return a jobs array")
+            return None
+        return jobs
+    except Exception as e:
+        logger.error(f"Batch extraction failed: {e}")
+        return None
+
+
 def _extract_with_regex_only(text: str, url: str = None) -> Dict:
     """
     Extract job details using only regex patterns (fallback when Ollama unavailable).
@@ -694,12 +1633,13 @@ def _extract_with_regex_only(text: str, url: str = None) -> Dict:
     logger.info("Using regex-only extraction")
     
     text_sample = text[:5000] if len(text) > 5000 else text
+    anchors = _scan_anchors(text_sample)
     
     job_data = {
-        'company': extract_company_regex(text_sample),
-        'position': extract_position_regex(text_sample),
-        'location': extract_location_regex(text_sample),
-        'salary': extract_salary_regex(text_sample),
+        'company': extract_company_regex(text_sample, anchors),
+        'position': extract_position_regex(text_sample, anchors),
+        'location': extract_location_regex(text_sample, anchors),
+        'salary': extract_salary_regex(text_sample, anchors),
         'deadline': None,
         'description': None,
         'url': url
@@ -708,131 +1648,257 @@ def _extract_with_regex_only(text: str, url: str = None) -> Dict:
     return job_data
 
 
-def extract_job_details_ollama(text: str, url: str = None) -> Dict:
+def _is_confident_regex_value(field: str, value) -> bool:
     """
-    Use Ollama (Llama 3.2) to extract job details using multi-pass strategy.
+    Check whether a regex answer is reliable enough to skip asking Ollama:
+    a labeled deadline or position, a salary with a currency, a location
+    naming a city or "Remote", or a company ending in Ltd/Limited.
+    
+    Args:
+        field: Field name
+        value: Regex result for the field
+        
+    Returns:
+        True if the value can be used as is
+    """
+    if not value:
+        return False
+    if field in ('deadline', 'position'):
+        return True
+    if field == 'salary':
+        return bool(_CONFIDENT_SALARY_RE.search(value))
+    if field == 'location':
+        return value == 'Remote' or 'city' in _find_location_keywords(value)
+    if field == 'company':
+        return bool(_CONFIDENT_COMPANY_RE.search(value))
+    return False
+
+
+def extract_job_details_ollama(text: str, url: str = None, force_llm: bool = False) -> Dict:
+    """
+    Use Ollama (Llama 3.2) to extract job details with a single JSON request,
+    falling back to the multi-pass strategy if that response is unusable.
+    Fields regex answers confidently are not sent to Ollama at all, and
+    Ollama is skipped entirely when that covers every field but the summary.
     Falls back to regex patterns if Ollama extraction fails.
     
     Args:
         text: Job posting text
         url: Job posting URL (optional)
+        force_llm: Ask Ollama even when regex answered every field
         
     Returns:
         Dictionary with extracted fields
     """
+    return _extract_job_details_ollama(text, url, force_llm)[0]
+
+
+def _extract_job_details_ollama(text: str, url: str, force_llm: bool) -> tuple:
+    """
+    Run extract_job_details_ollama and report whether its result is complete.
+    
+    Args:
+        text: Job posting text
+        url: Job posting URL (optional)
+        force_llm: Ask Ollama even when regex answered every field
+        
+    Returns:
+        Tuple of the extracted fields and whether they can be cached: False
+        when Ollama was unavailable or failed and regex filled in for it
+    """
     logger.info("Using Ollama (Llama 3.2) to extract job details")
     
     if not OLLAMA_AVAILABLE:
         logger.error("Ollama not available, using regex only")
-        return _extract_with_regex_only(text, url)
+        return _extract_with_regex_only(text, url), False
+    
+    # Limit text length
+    text_sample = text[:5000] if len(text) > 5000 else text
+    
+    # Initialize result dict
+    job_data = {
+        'company': None,
+        'position': None,
+        'deadline': None,
+        'salary': None,
+        'location': None,
+        'description': None,
+        'url': url
+    }
+    
+    # Labeled postings usually give the cheap fields away; only ask
+    # Ollama for what regex could not answer confidently
+    anchors = _scan_anchors(text_sample)
+    regex_results = {
+        'company': extract_company_regex(text_sample, anchors),
+        'position': extract_position_regex(text_sample, anchors, labeled_only=True),
+        'location': extract_location_regex(text_sample, anchors),
+        'salary': extract_salary_regex(text_sample, anchors),
+        'deadline': extract_deadline_regex(text_sample, standalone=False, anchors=anchors),
+    }
+    for field, value in regex_results.items():
+        if _is_confident_regex_value(field, value):
+            job_data[field] = value
+    pending = [field for field in EXTRACTION_FIELDS if job_data[field] is None]
+    
+    # The summary alone is not worth an Ollama round trip
+    if pending == ['description'] and not force_llm:
+        logger.info("Regex answered every field, skipping Ollama")
+        return job_data, True
     
     try:
         # Test Ollama connection
-        ollama.list()
+        _get_ollama_client().list()
         logger.info(f"Ollama connected, using model: {config.OLLAMA_MODEL}")
     except Exception as e:
         logger.error(f"Ollama not running or not accessible: {e}")
         logger.error("Make sure Ollama is running. Start it with: ollama serve")
-        return _extract_with_regex_only(text, url)
+        return _extract_with_regex_only(text, url), False
     
     try:
-        # Limit text length
-        text_sample = text[:5000] if len(text) > 5000 else text
+        if force_llm:
+            pending = list(EXTRACTION_FIELDS)
+        logger.info(f"Asking Ollama for: {', '.join(pending)}")
         
-        # Initialize result dict
-        job_data = {
-            'company': None,
-            'position': None,
-            'deadline': None,
-            'salary': None,
-            'location': None,
-            'description': None,
-            'url': url
-        }
+        # Ask for every pending field in one JSON response so the model only
+        # reads the posting once
+        results = _extract_all(text_sample, pending)
+        answered = results is not None
+        
+        if results is None:
+            # The passes are independent and each blocks on an Ollama request,
+            # so run them concurrently instead of one after another
+            passes = {
+                'company': _extract_company,
+                'position': _extract_position,
+                'location': _extract_location,
+                'salary': _extract_salary,
+                'deadline': _extract_deadline,
+                'description': _extract_description,
+            }
+            with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                futures = {field: executor.submit(passes[field], text_sample) for field in pending}
+                results = {field: future.result() for field, future in futures.items()}
+            # Every pass failing means Ollama went away mid-extraction
+            answered = any(results.values())
+        
+        # Fallback to regex for any field Ollama failed to extract
+        for field in ('company', 'location', 'salary'):
+            if field in results:
+                job_data[field] = results[field] or regex_results[field]
+        if 'position' in results:
+            job_data['position'] = results['position'] or extract_position_regex(text_sample, anchors)
         
-        # PASS 1: Extract company name
-        job_data['company'] = _extract_company(text_sample)
-        # Fallback to regex if Ollama failed
-        if not job_data['company']:
-            job_data['company'] = extract_company_regex(text_sample)
-        
-        # PASS 2: Extract position
-        job_data['position'] = _extract_position(text_sample)
-        # Fallback to regex if Ollama failed
-        if not job_data['position']:
-            job_data['position'] = extract_position_regex(text_sample)
-        
-        # PASS 3: Extract location
-        job_data['location'] = _extract_location(text_sample)
-        # Fallback to regex if Ollama failed
-        if not job_data['location']:
-            job_data['location'] = extract_location_regex(text_sample)
-        
-        # PASS 4: Extract salary
-        job_data['salary'] = _extract_salary(text_sample)
-        # Fallback to regex if Ollama failed
-        if not job_data['salary']:
-            job_data['salary'] = extract_salary_regex(text_sample)
-        
-        # PASS 5: Extract deadline
-        deadline_str = _extract_deadline(text_sample)
+        # Parse the deadline Ollama returned
+        deadline_str = results.get('deadline')
         if deadline_str:
             try:
-                deadline = dateparser.parse(
-                    deadline_str,
-                    settings={
-                        'TIMEZONE': str(config.TIMEZONE),
-                        'RETURN_AS_TIMEZONE_AWARE': True,
-                        'PREFER_DATES_FROM': 'future'
-                    }
-                )
-                job_data['deadline'] = deadline
+                job_data['deadline'] = _parse_date(deadline_str)
             except Exception:
                 job_data['deadline'] = None
         
-        # PASS 6: Extract description
-        job_data['description'] = _extract_description(text_sample)
+        job_data['description'] = results.get('description')
         
         logger.info(f"Extraction complete: {job_data}")
-        return job_data
+        return job_data, answered
         
     except Exception as e:
         logger.error(f"Ollama extraction failed: {str(e)}")
         logger.error(f"Traceback: {traceback.format_exc()}")
-        return _extract_with_regex_only(text, url)
+        return _extract_with_regex_only(text, url), False
+
+
+def _extraction_cache_key(text: str) -> tuple:
+    """
+    Build the result cache key for a posting.
+    
+    Args:
+        text: Job posting text
+        
+    Returns:
+        Tuple of the text's digest and today's local date
+    """
+    return (
+        hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest(),
+        datetime.now(config.TIMEZONE).date()
+    )
+
+
+def _get_cached_extraction(cache_key: tuple) -> Optional[Dict]:
+    """
+    Look up a cached extraction result.
+    
+    Args:
+        cache_key: Key from _extraction_cache_key
+        
+    Returns:
+        Copy of the cached fields, or None if the posting is not cached
+    """
+    with _extraction_cache_lock:
+        cached = _extraction_cache.get(cache_key)
+        if cached is None:
+            return None
+        _extraction_cache.move_to_end(cache_key)
+    return dict(cached)
 
 
-def extract_job_details(text: str, url: str = None) -> Dict:
+def _cache_extraction(cache_key: tuple, job_data: Dict):
+    """
+    Store an extraction result, dropping the oldest beyond EXTRACTION_CACHE_SIZE.
+    
+    Args:
+        cache_key: Key from _extraction_cache_key
+        job_data: Extracted fields
+    """
+    with _extraction_cache_lock:
+        _extraction_cache[cache_key] = dict(job_data)
+        if len(_extraction_cache) > EXTRACTION_CACHE_SIZE:
+            _extraction_cache.popitem(last=False)
+
+
+def extract_job_details(text: str, url: str = None, force_llm: bool = False) -> Dict:
     """
     Complete job extraction pipeline.
     
     1. Try regex for deadline
-    2. Use Ollama for all details (including deadline if regex failed)
+    2. Use Ollama for the details regex could not answer confidently
     3. Fall back to regex for each field if Ollama fails
     
     Args:
         text: Job posting text content
         url: Job posting URL (optional)
+        force_llm: Ask Ollama for every field, bypassing the result cache
         
     Returns:
         Dictionary with all extracted job details
     """
     logger.info("Starting job detail extraction pipeline")
     
-    # Step 1: Try regex for deadline
-    deadline = extract_deadline_regex(text)
-    
-    # Step 2: Use Ollama for other details
-    job_data = extract_job_details_ollama(text, url)
-    
-    # Use regex deadline if found and Ollama didn't find one
-    if deadline and not job_data.get('deadline'):
-        job_data['deadline'] = deadline
-        logger.info("Using regex-extracted deadline")
+    # Reuse the result if this exact posting was extracted today
+    cache_key = _extraction_cache_key(text)
+    cached = None if force_llm else _get_cached_extraction(cache_key)
+    if cached is not None:
+        logger.info("Using cached extraction for this posting")
+        job_data = cached
+    else:
+        # Step 1: Try regex for deadline
+        deadline = extract_deadline_regex(text)
+        
+        # Step 2: Use Ollama for other details
+        job_data, cacheable = _extract_job_details_ollama(text, url, force_llm)
+        
+        # Use regex deadline if found and Ollama didn't find one
+        if deadline and not job_data.get('deadline'):
+            job_data['deadline'] = deadline
+            logger.info("Using regex-extracted deadline")
+        
+        # A regex-only stand-in for Ollama is not kept, so the posting is
+        # extracted properly once Ollama is back
+        if cacheable:
+            _cache_extraction(cache_key, job_data)
     
-    # Ensure URL is in job data if provided
-    if url:
-        job_data['url'] = url
+    # The same posting may arrive with a different URL (or none)
+    job_data['url'] = url
     
     # Add extraction timestamp
     job_data['added_on'] = datetime.now(config.TIMEZONE)
@@ -840,6 +1906,105 @@ def extract_job_details(text: str, url: str = None) -> Dict:
     return job_data
 
 
+def _extract_batch_chunk(chunk: List[tuple], indexes: List[int]) -> List[Dict]:
+    """
+    Extract job details for one batch of postings with a single Ollama request.
+    
+    Args:
+        chunk: (text, url) pairs, at most EXTRACTION_BATCH_SIZE of them
+        indexes: Index of each posting in the whole batch (for logging)
+        
+    Returns:
+        List of dictionaries with all extracted job details, in chunk order
+    """
+    entries = _extract_batch([text[:5000] for text, _ in chunk]) or []
+    
+    job_list = []
+    for idx, (text, url) in enumerate(chunk):
+        entry = entries[idx] if idx < len(entries) else None
+        if not isinstance(entry, dict):
+            logger.info(f"No usable batch entry for posting {indexes[idx] + 1}, extracting it alone")
+            job_list.append(extract_job_details(text, url))
+            continue
+        
+        results = _clean_llm_fields(entry, EXTRACTION_FIELDS)
+        text_sample = text[:5000] if len(text) > 5000 else text
+        anchors = _scan_anchors(text_sample)
+        
+        # Fallback to regex for any field Ollama failed to extract
+        job_data = {
+            'company': results['company'] or extract_company_regex(text_sample, anchors),
+            'position': results['position'] or extract_position_regex(text_sample, anchors),
+            'deadline': None,
+            'salary': results['salary'] or extract_salary_regex(text_sample, anchors),
+            'location': results['location'] or extract_location_regex(text_sample, anchors),
+            'description': results['description'],
+            'url': url
+        }
+        
+        if results['deadline']:
+            try:
+                job_data['deadline'] = _parse_date(results['deadline'])
+            except Exception:
+                job_data['deadline'] = None
+        if not job_data['deadline']:
+            job_data['deadline'] = extract_deadline_regex(text)
+        
+        _cache_extraction(_extraction_cache_key(text), job_data)
+        
+        job_data['added_on'] = datetime.now(config.TIMEZONE)
+        job_list.append(job_data)
+    
+    return job_list
+
+
+def extract_job_details_batch(texts: List[str], urls: Optional[List[str]] = None) -> List[Dict]:
+    """
+    Extract job details for several postings, sharing one Ollama request
+    per EXTRACTION_BATCH_SIZE postings instead of one per posting, with up
+    to EXTRACTION_BATCH_WORKERS requests in flight.
+    Postings already in the result cache are answered from it, and those
+    the batch response does not cover are extracted one by one.
+    
+    Args:
+        texts: Job posting texts
+        urls: Job posting URLs, one per text (optional)
+        
+    Returns:
+        List of dictionaries with all extracted job details, in input order
+    """
+    urls = urls or [None] * len(texts)
+    
+    if not OLLAMA_AVAILABLE:
+        return [extract_job_details(text, url) for text, url in zip(texts, urls)]
+    
+    job_list = [None] * len(texts)
+    pending = []
+    for idx, (text, url) in enumerate(zip(texts, urls)):
+        if _get_cached_extraction(_extraction_cache_key(text)) is not None:
+            job_list[idx] = extract_job_details(text, url)
+        else:
+            pending.append(idx)
+    
+    if len(pending) < 2:
+        for idx in pending:
+            job_list[idx] = extract_job_details(texts[idx], urls[idx])
+        return job_list
+    
+    chunk_indexes = [
+        pending[start:start + EXTRACTION_BATCH_SIZE]
+        for start in range(0, len(pending), EXTRACTION_BATCH_SIZE)
+    ]
+    chunks = [[(texts[idx], urls[idx]) for idx in indexes] for indexes in chunk_indexes]
+    
+    with ThreadPoolExecutor(max_workers=min(EXTRACTION_BATCH_WORKERS, len(chunks))) as executor:
+        for indexes, chunk_jobs in zip(chunk_indexes, executor.map(_extract_batch_chunk, chunks, chunk_indexes)):
+            for idx, job_data in zip(indexes, chunk_jobs):
+                job_list[idx] = job_data
+    
+    return job_list
+
+
 def _get_default_job_data(url: str) -> Dict:
     """
     Return default job data structure when extraction fails.
@@ -2,10 +2,13 @@
 Automated reminder system for job deadlines.
 """
 
+import asyncio
 import logging
+import os
+from collections import defaultdict
 from datetime import time
 from typing import TYPE_CHECKING
-from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 import config
@@ -17,11 +20,23 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Persistent job store (optional)
+try:
+    from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+    SQLALCHEMY_AVAILABLE = True
+except ImportError:
+    SQLALCHEMY_AVAILABLE = False
+    logger.info("SQLAlchemy not installed, reminder schedule is kept in memory only")
+
 # Global scheduler instance
 _scheduler = None
 
+# Bot used by scheduled jobs; kept out of the job arguments so stored jobs
+# can be pickled
+_bot = None
+
 
-def check_and_send_reminders(bot: 'Bot'):
+async def check_and_send_reminders(bot: 'Bot'):
     """
     Check for upcoming deadlines and send reminders.
     Run daily at 8 AM Bangladesh time.
@@ -37,21 +52,32 @@ def check_and_send_reminders(bot: 'Bot'):
     
     try:
         # Get all jobs with deadlines in next 3 days (covers all reminder days)
-        jobs = sheets.get_upcoming_deadlines(days=max(config.REMINDER_DAYS))
+        # (the Sheets client is blocking, so keep it off the event loop)
+        jobs = await asyncio.to_thread(sheets.get_upcoming_deadlines, days=max(config.REMINDER_DAYS))
         
         if not jobs:
             logger.info("No upcoming deadlines found")
             return
         
-        # Group jobs by days left
-        for reminder_day in config.REMINDER_DAYS:
-            jobs_to_remind = [j for j in jobs if j['days_left'] == reminder_day]
-            
-            for job in jobs_to_remind:
-                try:
-                    _send_reminder(bot, job, reminder_day)
-                except Exception as e:
-                    logger.error(f"Failed to send reminder for {job.get('position', 'Unknown')}: {str(e)}")
+        # Group jobs by days left in one pass
+        jobs_by_day = defaultdict(list)
+        for job in jobs:
+            jobs_by_day[job['days_left']].append(job)
+        
+        # Send all reminders at once, in REMINDER_DAYS order
+        jobs_to_remind = [
+            job
+            for reminder_day in config.REMINDER_DAYS
+            for job in jobs_by_day.get(reminder_day, ())
+        ]
+        
+        results = await asyncio.gather(
+            *[_send_reminder(bot, job, job['days_left']) for job in jobs_to_remind],
+            return_exceptions=True
+        )
+        for job, result in zip(jobs_to_remind, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to send reminder for {job.get('position', 'Unknown')}: {str(result)}")
         
         logger.info(f"Reminder check completed, processed {len(jobs)} jobs")
     
@@ -59,7 +85,7 @@ def check_and_send_reminders(bot: 'Bot'):
         logger.error(f"Error in reminder check: {str(e)}")
 
 
-def _send_reminder(bot: 'Bot', job: dict, days_left: int):
+async def _send_reminder(bot: 'Bot', job: dict, days_left: int):
     """
     Send reminder notification for a specific job.
     
@@ -90,35 +116,95 @@ def _send_reminder(bot: 'Bot', job: dict, days_left: int):
     
     reply_markup = InlineKeyboardMarkup(keyboard)
     
-    try:
-        bot.send_message(
-            chat_id=config.TELEGRAM_USER_ID,
-            text=message,
-            reply_markup=reply_markup,
-            parse_mode='HTML'
-        )
-        logger.info("Reminder sent successfully")
-    except Exception as e:
-        logger.error(f"Failed to send reminder message: {str(e)}")
+    # Errors propagate to check_and_send_reminders, which logs them per job
+    await bot.send_message(
+        chat_id=config.TELEGRAM_USER_ID,
+        text=message,
+        reply_markup=reply_markup,
+        parse_mode='HTML'
+    )
+    logger.info("Reminder sent successfully")
+
+
+async def _run_reminders():
+    """Scheduled entry point for the daily reminder check."""
+    if _bot is None:
+        logger.error("Reminder job ran before the bot was set")
+        return
+    
+    await check_and_send_reminders(_bot)
+
+
+def _jobstores() -> dict:
+    """
+    Job stores for the scheduler: SQLite if SQLAlchemy is available,
+    otherwise APScheduler's default in-memory store.
+    
+    Returns:
+        Mapping of job store aliases to job stores
+    """
+    if not SQLALCHEMY_AVAILABLE:
+        return {}
+    
+    db_dir = os.path.dirname(config.SCHEDULER_DB)
+    if db_dir:
+        os.makedirs(db_dir, exist_ok=True)
+    
+    return {'default': SQLAlchemyJobStore(url=f'sqlite:///{config.SCHEDULER_DB}')}
+
+
+def _ensure_job(func, trigger: CronTrigger, job_id: str, name: str):
+    """
+    Add a daily job unless the job store already has it with the same trigger.
+    
+    Keeping the stored job keeps its next run time, so a run missed while
+    the bot was down still fires (within the misfire grace time).
+    
+    Args:
+        func: Job function
+        trigger: When to run
+        job_id: Job ID
+        name: Job name
+    """
+    job = _scheduler.get_job(job_id)
+    if job is not None and str(job.trigger) == str(trigger):
+        return
+    
+    _scheduler.add_job(
+        func=func,
+        trigger=trigger,
+        id=job_id,
+        name=name,
+        misfire_grace_time=config.SCHEDULER_MISFIRE_GRACE_TIME,
+        coalesce=True,
+        replace_existing=True
+    )
 
 
 def schedule_reminders(bot: 'Bot'):
     """
     Setup APScheduler to run reminder checks.
     
+    Must be called from within the bot's running event loop (e.g. the
+    Application's post_init hook), since the scheduler runs its jobs there.
+    
     Args:
         bot: Telegram bot instance
     """
-    global _scheduler
+    global _scheduler, _bot
     
     if _scheduler is not None:
         logger.warning("Scheduler already running")
         return
     
     logger.info("Setting up reminder scheduler")
+    _bot = bot
     
     try:
-        _scheduler = BackgroundScheduler(timezone=str(config.TIMEZONE))
+        _scheduler = AsyncIOScheduler(jobstores=_jobstores(), timezone=str(config.TIMEZONE))
+        
+        # Start paused so stored jobs can be checked before anything runs
+        _scheduler.start(paused=True)
         
         # Schedule daily reminder check at 8 AM Bangladesh time
         trigger = CronTrigger(
@@ -127,24 +213,13 @@ def schedule_reminders(bot: 'Bot'):
             timezone=config.TIMEZONE
         )
         
-        _scheduler.add_job(
-            func=lambda: check_and_send_reminders(bot),
-            trigger=trigger,
-            id='daily_reminder_check',
-            name='Daily Reminder Check',
-            replace_existing=True
-        )
+        _ensure_job(_run_reminders, trigger, 'daily_reminder_check', 'Daily Reminder Check')
         
         # Also schedule daily update of days left in sheet
-        _scheduler.add_job(
-            func=sheets.update_days_left,
-            trigger=trigger,
-            id='daily_sheet_update',
-            name='Daily Sheet Update',
-            replace_existing=True
-        )
+        # Plain functions are run in the executor's thread pool
+        _ensure_job(sheets.update_days_left, trigger, 'daily_sheet_update', 'Daily Sheet Update')
         
-        _scheduler.start()
+        _scheduler.resume()
         logger.info(f"Reminder scheduler started - will run daily at {config.REMINDER_TIME_HOUR}:00 {config.TIMEZONE}")
     
     except Exception as e:
@@ -161,7 +236,7 @@ def stop_scheduler():
         _scheduler = None
 
 
-def test_reminder_now(bot: 'Bot'):
+async def test_reminder_now(bot: 'Bot'):
     """
     Immediately run reminder check for testing.
     
@@ -169,7 +244,7 @@ def test_reminder_now(bot: 'Bot'):
         bot: Telegram bot instance
     """
     logger.info("Running immediate reminder test")
-    check_and_send_reminders(bot)
+    await check_and_send_reminders(bot)
 
 
 if __name__ == "__main__":
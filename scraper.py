@@ -1,93 +1,455 @@
 """
-Web scraping module using Jina AI Reader with fallback to BeautifulSoup.
+Web scraping module using Jina AI Reader with fallback to a direct fetch parsed by lxml.
 """
 
+import asyncio
+import codecs
 import logging
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import time
+import httpx
 import requests
-from bs4 import BeautifulSoup
-from typing import Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.etree
+import lxml.html
+from typing import List, Optional
+from urllib.parse import urlparse
 import config
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 for the async client needs the h2 package (optional)
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Maximum number of pages fetch_job_texts downloads at the same time
+FETCH_CONCURRENCY = 8
+
+# Media types (guessed from the URL path) that can never be a job posting
+UNSUPPORTED_MEDIA_PREFIXES = ('image/', 'video/', 'audio/')
+
+# Charset declared in a Content-Type header, and in a page's own <meta> tag
+# within its first META_CHARSET_SCAN_BYTES bytes
+_CHARSET_RE = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+META_CHARSET_SCAN_BYTES = 4096
+# lxml refuses str input that still carries an XML encoding declaration
+_XML_DECLARATION_RE = re.compile(r'^\s*<\?xml[^>]*\?>')
+
+BROWSER_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# Global HTTP session and async client instances
+_session = None
+_async_client = None
+
+# URL -> fetch task for async fetches in progress, so concurrent requests
+# for the same page share one download
+_inflight = {}
+
 
 class ScraperError(Exception):
     """Custom exception for scraping errors."""
     pass
 
 
-def fetch_job_text(url: str) -> dict:
+def _get_session() -> requests.Session:
+    """
+    Get or create the shared HTTP session.
+    Reusing it keeps connections (and TLS sessions) to Jina AI Reader and
+    job sites open between fetches; brief gateway errors are retried.
+    
+    Returns:
+        requests Session with pooled, retrying adapters
+    """
+    global _session
+    
+    if _session is None:
+        retry = Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=retry)
+        _session = requests.Session()
+        _session.mount('http://', adapter)
+        _session.mount('https://', adapter)
+    
+    return _session
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """
+    Get or create the shared async HTTP client used by the bot's event loop.
+    Uses HTTP/2 when the h2 package is installed.
+    
+    Returns:
+        httpx AsyncClient with pooled keep-alive connections
+    """
+    global _async_client
+    
+    if _async_client is None:
+        # With a transport given, httpx ignores the client's own pool and
+        # HTTP/2 settings, so they are all set on the transport
+        transport = httpx.AsyncHTTPTransport(
+            http2=HTTP2_AVAILABLE,
+            retries=2,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+        _async_client = httpx.AsyncClient(
+            timeout=config.REQUEST_TIMEOUT,
+            follow_redirects=True,
+            transport=transport,
+        )
+    
+    return _async_client
+
+
+def _cache_path(url: str) -> str:
+    """Path of the cache file for a URL."""
+    key = hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+    return os.path.join(config.SCRAPE_CACHE_DIR, f'{key}.json')
+
+
+def _cache_get(url: str) -> Optional[dict]:
+    """
+    Read a cached fetch result for a URL.
+    
+    Args:
+        url: Job posting URL
+        
+    Returns:
+        Fetch result dictionary, or None if missing, expired or unreadable
+    """
+    try:
+        with open(_cache_path(url), encoding='utf-8') as f:
+            payload = json.load(f)
+        if time.time() - payload['ts'] > config.SCRAPE_CACHE_TTL:
+            return None
+        logger.info(f"Using cached content for URL: {url}")
+        return _success_result(payload['text'], payload['source'])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _cache_set(url: str, result: dict) -> None:
+    """
+    Store a successful fetch result for a URL. Failures are never cached.
+    
+    Args:
+        url: Job posting URL
+        result: Successful fetch result dictionary
+    """
+    try:
+        os.makedirs(config.SCRAPE_CACHE_DIR, exist_ok=True)
+        path = _cache_path(url)
+        # Write then rename so a concurrent reader never sees half a file
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'text': result['text'], 'source': result['source'], 'ts': time.time()}, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Failed to cache content for URL: {str(e)}")
+
+
+def _is_unsupported_url(url: str) -> bool:
+    """
+    Check whether a URL obviously cannot be scraped, without any network call.
+    
+    Args:
+        url: Job posting URL
+        
+    Returns:
+        True for non-http(s) URLs and links to images, video or audio
+    """
+    parsed = urlparse(url)
+    if parsed.scheme not in ('http', 'https') or not parsed.netloc:
+        return True
+    
+    media_type, _ = mimetypes.guess_type(parsed.path)
+    return bool(media_type and media_type.startswith(UNSUPPORTED_MEDIA_PREFIXES))
+
+
+def _success_result(text: str, source: str) -> dict:
+    """Build the fetch_job_text result for fetched text."""
+    return {
+        'text': text,
+        'success': True,
+        'error': None,
+        'source': source
+    }
+
+
+def _failure_result() -> dict:
+    """Build the fetch_job_text result when every method failed."""
+    error_msg = (
+        "Could not scrape this URL. The website may require login, "
+        "block automated access, or be temporarily unavailable.\n\n"
+        "💡 Tip: Copy and paste the job description text directly, "
+        "and I'll extract the details for you!"
+    )
+    
+    return {
+        'text': '',
+        'success': False,
+        'error': error_msg,
+        'source': 'failed'
+    }
+
+
+def fetch_job_text(url: str, force_refresh: bool = False) -> dict:
     """
     Fetch clean text from job posting URL using Jina AI Reader.
-    Fallback to requests + BeautifulSoup if Jina fails.
+    Fallback to requests + lxml if Jina fails.
+    Successful fetches are cached on disk for config.SCRAPE_CACHE_TTL.
     
     Args:
         url: Job posting URL
+        force_refresh: Fetch again even if the URL is cached
         
     Returns:
         Dictionary with keys:
         - 'text': extracted text (empty string if failed)
         - 'success': bool indicating if fetch was successful
         - 'error': error message if failed (None if successful)
-        - 'source': 'jina', 'beautifulsoup', or 'failed'
+        - 'source': 'jina', 'lxml', or 'failed'
         
     Note: This function no longer raises ScraperError. Check 'success' field instead.
     """
+    if _is_unsupported_url(url):
+        logger.warning(f"Not fetching unsupported URL: {url}")
+        return _failure_result()
+    
+    cached = None if force_refresh else _cache_get(url)
+    if cached:
+        return cached
+    
     # Try Jina AI Reader first
     try:
         logger.info(f"Fetching content from URL using Jina AI Reader: {url}")
         text = _fetch_with_jina(url)
         if text:
             logger.info("Successfully fetched content with Jina AI Reader")
-            return {
-                'text': text,
-                'success': True,
-                'error': None,
-                'source': 'jina'
-            }
+            result = _success_result(text, 'jina')
+            _cache_set(url, result)
+            return result
     except Exception as e:
         logger.warning(f"Jina AI Reader failed: {str(e)}, trying fallback method")
     
-    # Fallback to BeautifulSoup
+    # Fallback to fetching the page directly
     try:
-        logger.info("Using BeautifulSoup fallback method")
-        text = _fetch_with_beautifulsoup(url)
+        logger.info("Using direct fetch fallback method")
+        text = _fetch_with_lxml(url)
         if text:
-            logger.info("Successfully fetched content with BeautifulSoup")
-            return {
-                'text': text,
-                'success': True,
-                'error': None,
-                'source': 'beautifulsoup'
-            }
+            logger.info("Successfully fetched content with lxml")
+            result = _success_result(text, 'lxml')
+            _cache_set(url, result)
+            return result
     except Exception as e:
-        logger.error(f"BeautifulSoup fallback also failed: {str(e)}")
+        logger.error(f"Direct fetch fallback also failed: {str(e)}")
     
     # Both methods failed
-    error_msg = (
-        "Could not scrape this URL. The website may require login, "
-        "block automated access, or be temporarily unavailable.\n\n"
-        "💡 Tip: Copy and paste the job description text directly, "
-        "and I'll extract the details for you!"
-    )
+    return _failure_result()
+
+
+async def fetch_job_text_async(url: str, force_refresh: bool = False) -> dict:
+    """
+    Async version of fetch_job_text for the bot's event loop, so a slow
+    site does not hold up other users' messages.
     
-    return {
-        'text': '',
-        'success': False,
-        'error': error_msg,
-        'source': 'failed'
-    }
+    Args:
+        url: Job posting URL
+        force_refresh: Fetch again even if the URL is cached
+        
+    Returns:
+        Same dictionary as fetch_job_text
+    """
+    if _is_unsupported_url(url):
+        logger.warning(f"Not fetching unsupported URL: {url}")
+        return _failure_result()
+    
+    cached = None if force_refresh else _cache_get(url)
+    if cached:
+        return cached
+    
+    # Join a fetch of the same URL that is already running
+    task = _inflight.get(url)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_job_text_async(url))
+        _inflight[url] = task
+        task.add_done_callback(lambda _: _inflight.pop(url, None))
+    else:
+        logger.info(f"Waiting for in-progress fetch of URL: {url}")
+    
+    # Shielded so a cancelled caller does not cancel the fetch for the others
+    return await asyncio.shield(task)
 
 
-def _fetch_with_jina(url: str) -> Optional[str]:
+async def fetch_job_texts(urls: List[str], force_refresh: bool = False) -> List[dict]:
     """
-    Fetch content using Jina AI Reader API.
+    Fetch several job posting URLs concurrently over the shared async client.
+    
+    At most FETCH_CONCURRENCY pages are downloaded at once; repeated URLs
+    share one fetch.
+    
+    Args:
+        urls: Job posting URLs
+        force_refresh: Fetch again even if a URL is cached
+        
+    Returns:
+        One fetch_job_text dictionary per URL, in the same order
+    """
+    semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+    
+    async def fetch(url: str) -> dict:
+        async with semaphore:
+            return await fetch_job_text_async(url, force_refresh)
+    
+    unique_urls = list(dict.fromkeys(urls))
+    results = await asyncio.gather(*[fetch(url) for url in unique_urls], return_exceptions=True)
+    
+    by_url = {}
+    for url, result in zip(unique_urls, results):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to fetch {url}: {str(result)}")
+            result = _failure_result()
+        by_url[url] = result
+    
+    return [by_url[url] for url in urls]
+
+
+async def _fetch_job_text_async(url: str) -> dict:
+    """
+    Fetch a URL with the async client, trying Jina AI Reader then the page.
+    
+    Args:
+        url: Job posting URL
+        
+    Returns:
+        Same dictionary as fetch_job_text
+    """
+    client = _get_async_client()
+    
+    # Try Jina AI Reader first
+    try:
+        logger.info(f"Fetching content from URL using Jina AI Reader: {url}")
+        jina_url, headers = _jina_request(url)
+        async with client.stream('GET', jina_url, headers=headers) as response:
+            response.raise_for_status()
+            content = await _read_capped_async(response)
+        text = _jina_text(_decode(content, response.encoding))
+        if text:
+            logger.info("Successfully fetched content with Jina AI Reader")
+            result = _success_result(text, 'jina')
+            _cache_set(url, result)
+            return result
+    except Exception as e:
+        logger.warning(f"Jina AI Reader failed: {str(e)}, trying fallback method")
+    
+    # Fallback to fetching the page directly
+    try:
+        logger.info("Using direct fetch fallback method")
+        async with client.stream('GET', url, headers={'User-Agent': BROWSER_USER_AGENT}) as response:
+            response.raise_for_status()
+            content = await _read_capped_async(response)
+        text = _html_to_text(_decode(content, _html_charset(content, response.headers.get('content-type'))))
+        if text:
+            logger.info("Successfully fetched content with lxml")
+            result = _success_result(text, 'lxml')
+            _cache_set(url, result)
+            return result
+    except Exception as e:
+        logger.error(f"Direct fetch fallback also failed: {str(e)}")
+    
+    # Both methods failed
+    return _failure_result()
+
+
+def _read_capped(response: requests.Response) -> bytes:
+    """
+    Read a streamed response body, stopping at config.MAX_SCRAPE_BYTES.
+    
+    Args:
+        response: Response opened with stream=True
+        
+    Returns:
+        Body bytes (possibly truncated)
+    """
+    buf = bytearray()
+    for chunk in response.iter_content(chunk_size=8192):
+        buf += chunk
+        if len(buf) >= config.MAX_SCRAPE_BYTES:
+            logger.info(f"Response body truncated at {config.MAX_SCRAPE_BYTES} bytes")
+            break
+    
+    return bytes(buf[:config.MAX_SCRAPE_BYTES])
+
+
+async def _read_capped_async(response: httpx.Response) -> bytes:
+    """
+    Async version of _read_capped for httpx streamed responses.
+    
+    Args:
+        response: Response opened with AsyncClient.stream
+        
+    Returns:
+        Body bytes (possibly truncated)
+    """
+    buf = bytearray()
+    async for chunk in response.aiter_bytes(chunk_size=8192):
+        buf += chunk
+        if len(buf) >= config.MAX_SCRAPE_BYTES:
+            logger.info(f"Response body truncated at {config.MAX_SCRAPE_BYTES} bytes")
+            break
+    
+    return bytes(buf[:config.MAX_SCRAPE_BYTES])
+
+
+def _decode(content: bytes, encoding: Optional[str]) -> str:
+    """Decode a (possibly truncated) response body."""
+    return content.decode(encoding or 'utf-8', errors='replace')
+
+
+def _html_charset(content: bytes, content_type: Optional[str]) -> str:
+    """
+    Pick the encoding of an HTML page: a byte order mark, then the
+    Content-Type charset, then the page's <meta> charset, then UTF-8.
+    Without one, lxml would read undeclared UTF-8 pages as latin-1.
+    
+    Args:
+        content: Raw HTML
+        content_type: Content-Type response header (optional)
+        
+    Returns:
+        Python codec name
+    """
+    if content.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    
+    match = _CHARSET_RE.search(content_type or '')
+    charset = match.group(1) if match else None
+    if charset is None:
+        match = _META_CHARSET_RE.search(content, 0, META_CHARSET_SCAN_BYTES)
+        charset = match.group(1).decode('ascii') if match else None
+    
+    try:
+        return codecs.lookup(charset).name if charset else 'utf-8'
+    except LookupError:
+        return 'utf-8'
+
+
+def _jina_request(url: str) -> tuple:
+    """
+    Build the Jina AI Reader URL and headers for a page.
     
     Args:
         url: URL to fetch
         
     Returns:
-        Clean text content or None if failed
+        Tuple of (Jina URL, request headers)
     """
     jina_url = f"{config.JINA_READER_URL}{url}"
     headers = {
@@ -98,27 +460,87 @@ def _fetch_with_jina(url: str) -> Optional[str]:
     if config.JINA_API_KEY:
         headers['Authorization'] = f'Bearer {config.JINA_API_KEY}'
     
+    return jina_url, headers
+
+
+def _jina_text(text: str) -> Optional[str]:
+    """
+    Clean a Jina AI Reader response.
+    
+    Args:
+        text: Response body
+        
+    Returns:
+        Stripped text or None if too short to be a posting
+    """
+    text = text.strip()
+    if len(text) > 100:  # Ensure we got substantial content
+        return text
+    
+    return None
+
+
+def _html_to_text(html: str) -> Optional[str]:
+    """
+    Extract readable text from an HTML page.
+    
+    Args:
+        html: Decoded HTML (see _html_charset)
+        
+    Returns:
+        Clean text content or None if too short to be a posting
+    """
+    tree = lxml.html.fromstring(_XML_DECLARATION_RE.sub('', html, count=1))
+    
+    # Remove script and style elements (template content is not page text
+    # either); the text after each element is kept
+    lxml.etree.strip_elements(tree, 'script', 'style', 'noscript', 'template', with_tail=False)
+    
+    # Get text
+    text = tree.text_content()
+    
+    # Clean up text
+    lines = (line.strip() for line in text.splitlines())
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    text = '\n'.join(chunk for chunk in chunks if chunk)
+    
+    if len(text) > 100:  # Ensure we got substantial content
+        return text
+    
+    return None
+
+
+def _fetch_with_jina(url: str) -> Optional[str]:
+    """
+    Fetch content using Jina AI Reader API.
+    
+    Args:
+        url: URL to fetch
+        
+    Returns:
+        Clean text content or None if failed
+    """
+    jina_url, headers = _jina_request(url)
+    
     try:
-        response = requests.get(
+        with _get_session().get(
             jina_url,
             headers=headers,
-            timeout=config.REQUEST_TIMEOUT
-        )
-        response.raise_for_status()
+            timeout=config.REQUEST_TIMEOUT,
+            stream=True
+        ) as response:
+            response.raise_for_status()
+            content = _read_capped(response)
         
-        text = response.text.strip()
-        if len(text) > 100:  # Ensure we got substantial content
-            return text
-        
-        return None
+        return _jina_text(_decode(content, response.encoding))
     except Exception as e:
         logger.warning(f"Jina AI Reader request failed: {str(e)}")
         return None
 
 
-def _fetch_with_beautifulsoup(url: str) -> Optional[str]:
+def _fetch_with_lxml(url: str) -> Optional[str]:
     """
-    Fetch content using requests and BeautifulSoup.
+    Fetch content using requests and lxml.
     
     Args:
         url: URL to fetch
@@ -127,37 +549,22 @@ def _fetch_with_beautifulsoup(url: str) -> Optional[str]:
         Clean text content or None if failed
     """
     headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        'User-Agent': BROWSER_USER_AGENT
     }
     
     try:
-        response = requests.get(
+        with _get_session().get(
             url,
             headers=headers,
-            timeout=config.REQUEST_TIMEOUT
-        )
-        response.raise_for_status()
+            timeout=config.REQUEST_TIMEOUT,
+            stream=True
+        ) as response:
+            response.raise_for_status()
+            content = _read_capped(response)
         
-        soup = BeautifulSoup(response.content, 'lxml')
-        
-        # Remove script and style elements
-        for script in soup(["script", "style", "noscript"]):
-            script.decompose()
-        
-        # Get text
-        text = soup.get_text()
-        
-        # Clean up text
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = '\n'.join(chunk for chunk in chunks if chunk)
-        
-        if len(text) > 100:  # Ensure we got substantial content
-            return text
-        
-        return None
+        return _html_to_text(_decode(content, _html_charset(content, response.headers.get('content-type'))))
     except Exception as e:
-        logger.error(f"BeautifulSoup fetch failed: {str(e)}")
+        logger.error(f"Direct fetch failed: {str(e)}")
         return None
 
 
@@ -2,8 +2,11 @@
 Google Sheets integration for job tracking.
 """
 
+import functools
 import logging
 import os
+import threading
+import time
 from datetime import datetime
 from typing import Optional, List, Dict
 from google.oauth2.service_account import Credentials
@@ -20,6 +23,56 @@ SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
 # Global service instance
 _sheets_service = None
 
+# How long a full sheet read is reused (seconds)
+UPCOMING_DEADLINES_TTL = 60
+
+# Bumped on every write so cached reads keyed on it go stale immediately
+_data_version = 0
+
+
+def _ttl_cache(ttl_seconds: int):
+    """
+    Cache a function's results for a limited time, keyed on its arguments.
+    
+    Exceptions are not cached.
+    
+    Args:
+        ttl_seconds: How long a cached result stays valid
+        
+    Returns:
+        Decorator
+    """
+    def decorator(func):
+        cache = {}
+        lock = threading.Lock()
+        
+        @functools.wraps(func)
+        def wrapper(*args):
+            now = time.monotonic()
+            with lock:
+                entry = cache.get(args)
+                if entry is not None and entry[1] > now:
+                    return entry[0]
+            
+            result = func(*args)
+            with lock:
+                # Drop expired entries (including ones for old data versions)
+                for key in [k for k, (_, expires_at) in cache.items() if expires_at <= now]:
+                    del cache[key]
+                cache[args] = (result, now + ttl_seconds)
+            return result
+        
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    
+    return decorator
+
+
+def _invalidate_cached_reads():
+    """Mark cached sheet reads as stale after a write."""
+    global _data_version
+    _data_version += 1
+
 
 def _get_sheets_service():
     """
@@ -124,6 +177,10 @@ def initialize_sheet() -> bool:
             body=body
         ).execute()
         
+        # The rules cover the whole days left column, so they are added
+        # once here rather than with every new row
+        _apply_conditional_formatting()
+        
         logger.info("Sheet initialized successfully")
         return True
     
@@ -132,57 +189,70 @@ def initialize_sheet() -> bool:
         return False
 
 
-def add_job(job_data: Dict) -> bool:
+def _format_job_row(job_data: Dict) -> List:
     """
-    Append job to sheet.
+    Build the sheet row for a job.
     
     Args:
         job_data: Dictionary with job information
         
+    Returns:
+        Row values in SHEET_HEADERS order
+    """
+    # Format deadline
+    deadline_str = ""
+    days_left = ""
+    if job_data.get('deadline'):
+        if isinstance(job_data['deadline'], datetime):
+            deadline_str = job_data['deadline'].strftime('%Y-%m-%d')
+            days_left = str(utils.calculate_days_left(job_data['deadline']))
+        else:
+            deadline_str = str(job_data['deadline'])
+    
+    # Format added_on timestamp
+    added_on_str = ""
+    if job_data.get('added_on'):
+        if isinstance(job_data['added_on'], datetime):
+            added_on_str = job_data['added_on'].strftime('%Y-%m-%d %H:%M')
+        else:
+            added_on_str = str(job_data['added_on'])
+    else:
+        added_on_str = utils.get_current_time().strftime('%Y-%m-%d %H:%M')
+    
+    return [
+        job_data.get('company', 'Unknown'),
+        job_data.get('position', 'Unknown'),
+        deadline_str,
+        days_left,
+        job_data.get('url', ''),
+        'Open',  # Status
+        job_data.get('salary', ''),
+        job_data.get('location', ''),
+        added_on_str
+    ]
+
+
+def add_jobs(job_list: List[Dict]) -> bool:
+    """
+    Append several jobs to the sheet with a single API request.
+    
+    Args:
+        job_list: Dictionaries with job information
+        
     Returns:
         True if successful, False otherwise
     """
-    logger.info(f"Adding job to sheet: {job_data.get('position', 'Unknown')}")
+    if not job_list:
+        return True
+    
+    logger.info(f"Adding {len(job_list)} job(s) to sheet")
     
     try:
         service = _get_sheets_service()
         sheet_id = config.GOOGLE_SHEET_ID
         
-        # Format deadline
-        deadline_str = ""
-        days_left = ""
-        if job_data.get('deadline'):
-            if isinstance(job_data['deadline'], datetime):
-                deadline_str = job_data['deadline'].strftime('%Y-%m-%d')
-                days_left = str(utils.calculate_days_left(job_data['deadline']))
-            else:
-                deadline_str = str(job_data['deadline'])
-        
-        # Format added_on timestamp
-        added_on_str = ""
-        if job_data.get('added_on'):
-            if isinstance(job_data['added_on'], datetime):
-                added_on_str = job_data['added_on'].strftime('%Y-%m-%d %H:%M')
-            else:
-                added_on_str = str(job_data['added_on'])
-        else:
-            added_on_str = utils.get_current_time().strftime('%Y-%m-%d %H:%M')
-        
-        # Prepare row data
-        row = [
-            job_data.get('company', 'Unknown'),
-            job_data.get('position', 'Unknown'),
-            deadline_str,
-            days_left,
-            job_data.get('url', ''),
-            'Open',  # Status
-            job_data.get('salary', ''),
-            job_data.get('location', ''),
-            added_on_str
-        ]
-        
-        # Append row
-        body = {'values': [row]}
+        # Append all rows at once
+        body = {'values': [_format_job_row(job_data) for job_data in job_list]}
         result = service.spreadsheets().values().append(
             spreadsheetId=sheet_id,
             range='A:I',
@@ -191,22 +261,95 @@ def add_job(job_data: Dict) -> bool:
             body=body
         ).execute()
         
-        logger.info(f"Job added successfully: {result.get('updates', {}).get('updatedRows', 0)} row(s) added")
-        
-        # Apply conditional formatting to days left
-        _apply_conditional_formatting()
-        
+        _invalidate_cached_reads()
+        logger.info(f"Jobs added successfully: {result.get('updates', {}).get('updatedRows', 0)} row(s) added")
         return True
     
     except Exception as e:
-        logger.error(f"Failed to add job to sheet: {str(e)}")
+        logger.error(f"Failed to add jobs to sheet: {str(e)}")
         return False
 
 
+def add_job(job_data: Dict) -> bool:
+    """
+    Append job to sheet.
+    
+    Args:
+        job_data: Dictionary with job information
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    logger.info(f"Adding job to sheet: {job_data.get('position', 'Unknown')}")
+    return add_jobs([job_data])
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_sheet_date(deadline_str: str) -> datetime:
+    """
+    Parse a deadline cell written by add_job.
+    
+    Splits the fixed YYYY-MM-DD format directly instead of going through
+    strptime.
+    
+    Args:
+        deadline_str: Date in YYYY-MM-DD format
+        
+    Returns:
+        Timezone-aware deadline datetime
+        
+    Raises:
+        ValueError: If the cell is not a valid YYYY-MM-DD date
+    """
+    year, month, day = deadline_str.split('-')
+    deadline = datetime(int(year), int(month), int(day))
+    # pytz zones must be attached with localize, not tzinfo=
+    return config.TIMEZONE.localize(deadline)
+
+
+@_ttl_cache(ttl_seconds=UPCOMING_DEADLINES_TTL)
+def _load_all_rows(version: int) -> List[Dict]:
+    """
+    Read every job row with a single request and parse the deadlines.
+    
+    Args:
+        version: Sheet data version, only used as part of the cache key
+        
+    Returns:
+        List of dicts with the sheet row number, the raw cell values and
+        the parsed deadline (None if the cell is empty or invalid)
+    """
+    service = _get_sheets_service()
+    sheet_id = config.GOOGLE_SHEET_ID
+    
+    # Get all rows
+    result = service.spreadsheets().values().get(
+        spreadsheetId=sheet_id,
+        range='A2:I'  # Skip header
+    ).execute()
+    
+    rows = []
+    for idx, row in enumerate(result.get('values', []), start=2):
+        deadline = None
+        deadline_str = row[2] if len(row) > 2 else ''
+        if deadline_str:
+            try:
+                deadline = _parse_sheet_date(deadline_str)
+            except Exception as e:
+                logger.warning(f"Failed to parse deadline in row {idx}: {str(e)}")
+        
+        rows.append({'row': idx, 'values': row, 'deadline': deadline})
+    
+    return rows
+
+
 def get_upcoming_deadlines(days: int = 7) -> List[Dict]:
     """
     Get jobs with deadlines in next N days.
     
+    The sheet read is reused for UPCOMING_DEADLINES_TTL seconds, or until
+    the next write.
+    
     Args:
         days: Number of days to look ahead
         
@@ -216,52 +359,33 @@ def get_upcoming_deadlines(days: int = 7) -> List[Dict]:
     logger.info(f"Getting upcoming deadlines (next {days} days)")
     
     try:
-        service = _get_sheets_service()
-        sheet_id = config.GOOGLE_SHEET_ID
-        
-        # Get all rows
-        result = service.spreadsheets().values().get(
-            spreadsheetId=sheet_id,
-            range='A2:I'  # Skip header
-        ).execute()
-        
-        values = result.get('values', [])
+        rows = _load_all_rows(_data_version)
         jobs = []
         
+        # One clock reading for the whole sheet
         now = utils.get_current_time()
         
-        for row in values:
-            if len(row) < 6:  # Ensure minimum columns
+        for entry in rows:
+            row = entry['values']
+            deadline = entry['deadline']
+            if len(row) < 6 or deadline is None:  # Ensure minimum columns
                 continue
             
-            # Parse deadline
-            try:
-                deadline_str = row[2] if len(row) > 2 else ''
-                if not deadline_str:
-                    continue
-                
-                deadline = datetime.strptime(deadline_str, '%Y-%m-%d')
-                deadline = config.TIMEZONE.localize(deadline)
-                
-                days_until = utils.calculate_days_left(deadline)
-                
-                # Check if within range and not applied
-                status = row[5] if len(row) > 5 else 'Open'
-                if 0 <= days_until <= days and status != 'Applied':
-                    job = {
-                        'company': row[0] if len(row) > 0 else '',
-                        'position': row[1] if len(row) > 1 else '',
-                        'deadline': deadline,
-                        'days_left': days_until,
-                        'url': row[4] if len(row) > 4 else '',
-                        'status': status,
-                        'salary': row[6] if len(row) > 6 else '',
-                        'location': row[7] if len(row) > 7 else ''
-                    }
-                    jobs.append(job)
-            except Exception as e:
-                logger.warning(f"Failed to parse job row: {str(e)}")
-                continue
+            days_until = utils.calculate_days_left(deadline, now)
+            
+            # Check if within range and not applied
+            status = row[5]
+            if 0 <= days_until <= days and status != 'Applied':
+                jobs.append({
+                    'company': row[0],
+                    'position': row[1],
+                    'deadline': deadline,
+                    'days_left': days_until,
+                    'url': row[4],
+                    'status': status,
+                    'salary': row[6] if len(row) > 6 else '',
+                    'location': row[7] if len(row) > 7 else ''
+                })
         
         # Sort by deadline (nearest first)
         jobs.sort(key=lambda x: x['deadline'])
@@ -302,6 +426,7 @@ def mark_as_applied(row_number: int) -> bool:
             body=body
         ).execute()
         
+        _invalidate_cached_reads()
         logger.info(f"Row {row_number} marked as applied")
         return True
     
@@ -310,10 +435,42 @@ def mark_as_applied(row_number: int) -> bool:
         return False
 
 
+def _coalesce_column_updates(column: str, cells: List) -> List[Dict]:
+    """
+    Merge single-cell updates on consecutive rows into range updates.
+    
+    Args:
+        column: Column letter
+        cells: (row number, value) pairs in ascending row order
+        
+    Returns:
+        batchUpdate data entries, one per run of consecutive rows
+    """
+    updates = []
+    start = prev = None
+    values = []
+    
+    for row_number, value in cells:
+        if prev is not None and row_number != prev + 1:
+            updates.append({'range': f'{column}{start}:{column}{prev}', 'values': values})
+            values = []
+        if not values:
+            start = row_number
+        values.append([value])
+        prev = row_number
+    
+    if values:
+        updates.append({'range': f'{column}{start}:{column}{prev}', 'values': values})
+    
+    return updates
+
+
 def update_days_left() -> bool:
     """
     Recalculate days left for all jobs.
     
+    Only cells whose value actually changed are written.
+    
     Returns:
         True if successful, False otherwise
     """
@@ -323,35 +480,22 @@ def update_days_left() -> bool:
         service = _get_sheets_service()
         sheet_id = config.GOOGLE_SHEET_ID
         
-        # Get all rows
-        result = service.spreadsheets().values().get(
-            spreadsheetId=sheet_id,
-            range='A2:I'
-        ).execute()
+        changed = []
         
-        values = result.get('values', [])
-        updates = []
+        # One clock reading for the whole sheet
+        now = utils.get_current_time()
         
-        for idx, row in enumerate(values, start=2):
-            if len(row) < 3:
+        for entry in _load_all_rows(_data_version):
+            row = entry['values']
+            if entry['deadline'] is None:
                 continue
             
-            deadline_str = row[2] if len(row) > 2 else ''
-            if not deadline_str:
-                continue
-            
-            try:
-                deadline = datetime.strptime(deadline_str, '%Y-%m-%d')
-                deadline = config.TIMEZONE.localize(deadline)
-                days_left = utils.calculate_days_left(deadline)
-                
-                updates.append({
-                    'range': f'D{idx}',
-                    'values': [[str(days_left)]]
-                })
-            except Exception as e:
-                logger.warning(f"Failed to update row {idx}: {str(e)}")
-                continue
+            days_left = str(utils.calculate_days_left(entry['deadline'], now))
+            current = row[3] if len(row) > 3 else ''
+            if days_left != current:
+                changed.append((entry['row'], days_left))
+        
+        updates = _coalesce_column_updates('D', changed)
         
         if updates:
             body = {
@@ -364,7 +508,8 @@ def update_days_left() -> bool:
                 body=body
             ).execute()
             
-            logger.info(f"Updated {len(updates)} rows")
+            _invalidate_cached_reads()
+            logger.info(f"Updated {len(changed)} rows in {len(updates)} range(s)")
         
         return True
     
@@ -373,12 +518,45 @@ def update_days_left() -> bool:
         return False
 
 
+def _has_days_left_formatting(service, sheet_id: str) -> bool:
+    """
+    Check whether the days left column already has conditional formatting.
+    
+    Args:
+        service: Google Sheets API service
+        sheet_id: Spreadsheet ID
+        
+    Returns:
+        True if a rule on column D exists in the first sheet
+    """
+    result = service.spreadsheets().get(
+        spreadsheetId=sheet_id,
+        includeGridData=False,
+        fields='sheets(properties.sheetId,conditionalFormats.ranges)'
+    ).execute()
+    
+    # The API leaves out zero values, so a missing sheetId/index means 0
+    for sheet in result.get('sheets', []):
+        if sheet.get('properties', {}).get('sheetId', 0) != 0:
+            continue
+        for rule in sheet.get('conditionalFormats', []):
+            for grid_range in rule.get('ranges', []):
+                if grid_range.get('startColumnIndex', 0) == 3 and grid_range.get('endColumnIndex') == 4:
+                    return True
+    
+    return False
+
+
 def _apply_conditional_formatting():
-    """Apply conditional formatting to days left column."""
+    """Apply conditional formatting to days left column (once)."""
     try:
         service = _get_sheets_service()
         sheet_id = config.GOOGLE_SHEET_ID
         
+        if _has_days_left_formatting(service, sheet_id):
+            logger.info("Conditional formatting already present")
+            return
+        
         requests = [
             # Red: < 3 days
             {
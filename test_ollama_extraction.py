@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Tests for the Ollama extraction pipeline and its result cache, with the
+Ollama client replaced by a local stand-in.
+
+Run with pytest (or directly: python test_ollama_extraction.py).
+"""
+
+import json
+import re
+import sys
+import time
+from collections import OrderedDict
+import pytest
+import extractor
+
+
+# Posting with nothing regex can answer confidently, so Ollama is asked
+POSTING = "We need someone great to build our APIs.\nWrite to jobs@acme.example"
+
+# Answer the stand-in gives for every posting; postings numbered with
+# "Opening number N" get the position "Developer N"
+ANSWER = {
+    'company': 'Acme',
+    'position': 'Backend Developer',
+    'location': 'Dhaka',
+    'salary': None,
+    'deadline': None,
+    'description': 'Build APIs.',
+}
+_NUMBER_RE = re.compile(r'Opening number (\d+)')
+
+
+def _posting(number):
+    """Numbered posting with nothing regex can answer confidently."""
+    return f"Opening number {number}\n{POSTING}"
+
+
+def _answer(number):
+    """Fields the stand-in answers for a posting."""
+    return dict(ANSWER, position=f'Developer {number}') if number else dict(ANSWER)
+
+
+class FakeOllama:
+    """
+    Ollama client stand-in answering every field with ANSWER. Batch
+    answers can leave out the last entries or replace some with a string.
+    """
+
+    def __init__(self):
+        self.down = False
+        self.prompts = []
+        self.batches = []
+        self.batch_schemas = []
+        self.missing = 0
+        self.malformed = set()
+
+    def list(self):
+        if self.down:
+            raise ConnectionError("Ollama is not running")
+
+    def generate(self, model, prompt, keep_alive=None, format=None, options=None):
+        if self.down:
+            raise ConnectionError("Ollama is not running")
+        self.prompts.append(prompt)
+        fields = format['properties']
+        if 'jobs' in fields:
+            numbers = _NUMBER_RE.findall(prompt)
+            self.batches.append(numbers)
+            self.batch_schemas.append(fields['jobs'])
+            # Let later batches finish first
+            if '1' in numbers:
+                time.sleep(0.05)
+            jobs = ['not an object' if number in self.malformed else _answer(number) for number in numbers]
+            return {'response': json.dumps({'jobs': jobs[:len(jobs) - self.missing]})}
+        number = _NUMBER_RE.search(prompt)
+        answer = _answer(number.group(1) if number else None)
+        return {'response': json.dumps({field: answer[field] for field in fields})}
+
+
+@pytest.fixture
+def fake_ollama(monkeypatch):
+    """Route extraction to a FakeOllama with an empty result cache."""
+    client = FakeOllama()
+    monkeypatch.setattr(extractor, 'OLLAMA_AVAILABLE', True)
+    monkeypatch.setattr(extractor, '_get_ollama_client', lambda: client)
+    monkeypatch.setattr(extractor, '_extraction_cache', OrderedDict())
+    return client
+
+
+def test_extraction_cached(fake_ollama):
+    """Test a repeated posting is answered from the cache."""
+    first = extractor.extract_job_details(POSTING, 'https://example.com/1')
+    second = extractor.extract_job_details(POSTING, 'https://example.com/2')
+
+    assert first['position'] == second['position'] == 'Backend Developer'
+    assert second['url'] == 'https://example.com/2'
+    assert len(fake_ollama.prompts) == 1
+
+
+def test_regex_fallback_not_cached(fake_ollama):
+    """Test results made while Ollama is down are redone once it is back."""
+    fake_ollama.down = True
+    degraded = extractor.extract_job_details(POSTING)
+
+    assert degraded['position'] is None
+    assert not extractor._extraction_cache
+
+    fake_ollama.down = False
+    job_data = extractor.extract_job_details(POSTING)
+
+    assert job_data['position'] == 'Backend Developer'
+    assert len(extractor._extraction_cache) == 1
+
+
+def test_batch_keeps_input_order(fake_ollama):
+    """Test batch results come back in input order across chunks."""
+    count = 2 * extractor.EXTRACTION_BATCH_SIZE + 1
+    jobs = extractor.extract_job_details_batch([_posting(n) for n in range(1, count + 1)])
+
+    assert [job['position'] for job in jobs] == [f'Developer {n}' for n in range(1, count + 1)]
+    # The schema pins each jobs array to the number of postings sent
+    sizes = [len(numbers) for numbers in fake_ollama.batches]
+    assert sorted(sizes) == [1, extractor.EXTRACTION_BATCH_SIZE, extractor.EXTRACTION_BATCH_SIZE]
+    for size, schema in zip(sizes, fake_ollama.batch_schemas):
+        assert schema['minItems'] == schema['maxItems'] == size
+
+
+def test_batch_short_jobs_array(fake_ollama):
+    """Test postings missing from a short jobs array are extracted alone."""
+    fake_ollama.missing = 2
+    jobs = extractor.extract_job_details_batch([_posting(n) for n in range(1, 5)])
+
+    assert [job['position'] for job in jobs] == [f'Developer {n}' for n in range(1, 5)]
+    assert fake_ollama.batches == [['1', '2', '3', '4']]
+    assert len(fake_ollama.prompts) == 3
+
+
+def test_batch_malformed_entry(fake_ollama):
+    """Test a non-object batch entry falls back to extracting that posting alone."""
+    fake_ollama.malformed = {'2'}
+    jobs = extractor.extract_job_details_batch([_posting(n) for n in range(1, 4)], ['u1', 'u2', 'u3'])
+
+    assert [job['position'] for job in jobs] == ['Developer 1', 'Developer 2', 'Developer 3']
+    assert [job['url'] for job in jobs] == ['u1', 'u2', 'u3']
+    assert len(fake_ollama.prompts) == 2
+
+
+def test_batch_uses_result_cache(fake_ollama):
+    """Test cached postings skip the batch and batch results are cached."""
+    extractor.extract_job_details(_posting(1))
+    jobs = extractor.extract_job_details_batch([_posting(n) for n in range(1, 4)])
+
+    assert [job['position'] for job in jobs] == ['Developer 1', 'Developer 2', 'Developer 3']
+    assert fake_ollama.batches == [['2', '3']]
+
+    prompts = len(fake_ollama.prompts)
+    extractor.extract_job_details_batch([_posting(n) for n in range(1, 4)])
+
+    assert len(fake_ollama.prompts) == prompts
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
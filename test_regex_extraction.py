@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Tests for the regex extraction internals: anchor scanning, fused label
+scans, line-based label lookup and the RE2 pattern rewrite.
+Each extraction test runs once with RE2 and once with plain re.
+
+Run with pytest (or directly: python test_regex_extraction.py).
+"""
+
+import importlib.util
+import re
+import sys
+from datetime import datetime
+import pytest
+import config
+import extractor
+
+
+@pytest.fixture(scope="module", params=["re2", "re"])
+def engine(request):
+    """The extractor module scanning with RE2, or a copy limited to re."""
+    if request.param == "re2":
+        if not extractor.RE2_AVAILABLE:
+            pytest.skip("google-re2 not installed")
+        return extractor
+
+    # A separate copy of the module, imported with the optional scanners
+    # blocked, so the shared extractor module is left untouched
+    spec = importlib.util.spec_from_file_location("extractor_re_only", extractor.__file__)
+    module = importlib.util.module_from_spec(spec)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(sys.modules, "re2", None)
+        mp.setitem(sys.modules, "ahocorasick", None)
+        spec.loader.exec_module(module)
+    assert not module.RE2_AVAILABLE and module._LOCATION_AUTOMATON is None
+    return module
+
+
+class _PatternSpy:
+    """Compiled pattern wrapper recording whether it was used."""
+
+    def __init__(self, pattern):
+        self.pattern = pattern
+        self.used = False
+
+    def search(self, *args):
+        self.used = True
+        return self.pattern.search(*args)
+
+    def match(self, *args):
+        self.used = True
+        return self.pattern.match(*args)
+
+
+# Python patterns and their RE2 rewrites
+RE2_REWRITES = [
+    (r"\d+", r"\p{Nd}+"),
+    (r"Tk\s*\d", r"Tk[\s\p{Z}\x{0b}\x{1c}-\x{1f}\x{85}]*\p{Nd}"),
+    (r"[\d,]+", r"[\p{Nd},]+"),
+    (r"[^\s]", r"[^\s\p{Z}\x{0b}\x{1c}-\x{1f}\x{85}]"),
+    (r"\\d", r"\\d"),
+    (r"\bTk\b", r"\bTk\b"),
+    (r"a\.b", r"a\.b"),
+]
+
+# Text that \d and \s must match the way Python's re does
+UNICODE_DIGITS_AND_SPACES = [
+    (r"\d+", "২০৩০"),
+    (r"Tk\s*\d", "Tk\xa0২"),
+    (r"[\d,]+", "২২,০০০"),
+    (r"a\sb", "a b"),
+    (r"a\sb", "a\x85b"),
+]
+
+# Texts and the anchors present in them
+ANCHOR_CASES = [
+    ("Company: Acme\nSalary: Tk 5", {"company_label", "salary_label", "salary_keyword", "currency"}),
+    ("POSITION: Intern\nJob Title: Dev", {"position_label", "job_title_label"}),
+    ("Apply before 5 March", {"deadline_label"}),
+    ("Since 2010 we pay well", {"company_suffix", "salary_keyword"}),
+    ("শেষ তারিখ ৳", {"deadline_label", "currency"}),
+    ("Nothing here at all", set()),
+]
+
+# Texts with several labels, repeated labels and labels inside values
+LABEL_UNION_TEXTS = [
+    "Company: Acme Corporation\nOrganization: Tech Solutions",
+    "Organization: Tech Solutions\nCompany: Acme Corporation\nCompany: Other Ltd",
+    "Position: Software Engineer\nRole: Data Analyst\nVacancy: Senior Developer",
+    "Hiring for: HR Intern to join\nPosition: Backend Developer Job",
+    "Vacancy: Role: Designer\nRole: Data Analyst",
+    "Nothing labeled here",
+]
+
+# (text, labeled salary value, labeled location value)
+LABELED_VALUE_CASES = [
+    ("Salary: Tk. 22,000 (Monthly)\nLocation: Gulshan", "Tk. 22,000 (Monthly)", "Gulshan"),
+    # Label at the end of its line takes the next non-blank line
+    ("Salary:\n\n  Tk. 22,000\nMore", "Tk. 22,000", None),
+    ("Job Location:\n• Dhaka (Niketon)\n", None, "• Dhaka (Niketon)"),
+    # Overlapping labels resolve to the leftmost one
+    ("Job Location: Gulshan 2, Dhaka\nLocation: Elsewhere", None, "Gulshan 2, Dhaka"),
+    ("MONTHLY SALARY: BDT 50,000", "BDT 50,000", None),
+    ("Salary:", None, None),
+    ("No labels at all", None, None),
+]
+
+# Currency matches: ranges beat single amounts, currency-first beats
+# amount-first, and a currency ending an amount-first match can start
+# its own match
+SALARY_PRECEDENCE_CASES = [
+    ("Tk 50000 bonus, BDT 25,000 - 35,000", "BDT 25,000 - 35,000"),
+    ("22,000 - 30,000 BDT and Tk 5000", "Tk 5000"),
+    ("50000+ BDT or 20k-30k Tk", "20k-30k Tk"),
+    ("Road 10, Tk 25,000", "Tk 25,000"),
+    ("Pay is Tk.\xa0২২,০০০ - ৩০,০০০ per month", "Tk. ২২,০০০ - ৩০,০০০ per month"),
+    ("Salary\xa0Tk\xa025,000", "Tk 25,000"),
+]
+
+# Locations found through the keyword scan (Aho-Corasick or regex)
+LOCATION_KEYWORD_CASES = [
+    ("Our office is in Gulshan 2, Dhaka 1212", "Our office is in Gulshan 2, Dhaka 1212"),
+    ("Work at Banani.", "Banani"),
+    ("This is a remote job", "Remote"),
+    ("Remotely managed team", None),
+]
+
+# Dates the fast parser handles without dateparser
+FAST_DATES = [
+    ("2027-03-05", datetime(2027, 3, 5)),
+    ("5 March 2027", datetime(2027, 3, 5)),
+    ("5 Mar 2027", datetime(2027, 3, 5)),
+    ("March 5, 2027", datetime(2027, 3, 5)),
+    ("Mar 5 2027", datetime(2027, 3, 5)),
+    (" 2027-03-05 ", datetime(2027, 3, 5)),
+    ("05/03/2027", None),
+    ("৫ March 2027", None),
+    ("next friday", None),
+]
+
+
+# Keyword groups for _slice_around, strongest first
+WINDOW_KEYWORDS = (("salary:",), ("tk", "bdt"))
+
+
+@pytest.mark.parametrize("pattern,expected", RE2_REWRITES)
+def test_re2_rewrite(pattern, expected):
+    """Test \\d and \\s are widened inside and outside character classes."""
+    assert extractor._to_re2_syntax(pattern) == expected
+
+
+@pytest.mark.parametrize("pattern,text", UNICODE_DIGITS_AND_SPACES)
+def test_re2_rewrite_matches_unicode(pattern, text):
+    """Test rewritten patterns match Bengali digits and Unicode spaces like re."""
+    re2 = pytest.importorskip("re2")
+
+    assert re.fullmatch(pattern, text)
+    assert re2.compile(extractor._to_re2_syntax(pattern)).fullmatch(text)
+
+
+@pytest.mark.parametrize("text,expected", ANCHOR_CASES)
+def test_scan_anchors(engine, text, expected):
+    """Test the anchor scan reports exactly the anchors present."""
+    assert engine._scan_anchors(text) == expected
+
+
+@pytest.mark.parametrize("text", LABEL_UNION_TEXTS)
+def test_label_union_matches_separate_patterns(engine, text):
+    """Test one fused label scan finds what each label pattern finds alone."""
+    for union_re, indexes, patterns in (
+        (engine._COMPANY_LABELS_RE, engine._COMPANY_LABEL_INDEXES, engine._COMPANY_PATTERNS),
+        (engine._POSITION_LABELS_RE, engine._POSITION_LABEL_INDEXES, engine._POSITION_PATTERNS),
+    ):
+        values = engine._first_label_values(union_re, text)
+        for idx in indexes:
+            match = engine._search_labeled(patterns[idx][1], text)
+            assert values.get(idx) == (match.group(1) if match else None)
+
+
+@pytest.mark.parametrize("text,salary,location", LABELED_VALUE_CASES)
+def test_find_labeled_value(engine, text, salary, location):
+    """Test the line scan finds labeled values, including on the next line."""
+    assert engine._find_labeled_value(text, engine._SALARY_LABELS, engine._SALARY_LABELED_RE) == salary
+    assert engine._find_labeled_value(text, engine._LOCATION_LABELS, engine._LOCATION_LABELED_RE) == location
+
+
+def test_find_labeled_value_lowercase_changes_length(engine):
+    """Test texts whose lowercase is longer fall back to the labeled regex."""
+    text = "İstanbul office\nSalary:\nTk 5,000\n"
+    assert len(text.lower()) != len(text)
+
+    spy = _PatternSpy(engine._SALARY_LABELED_RE)
+    assert engine._find_labeled_value(text, engine._SALARY_LABELS, spy) == "Tk 5,000"
+    assert spy.used
+
+
+def test_find_labeled_value_skips_regex(engine):
+    """Test plain texts are handled by the line scan alone."""
+    spy = _PatternSpy(engine._SALARY_LABELED_RE)
+    assert engine._find_labeled_value("Salary: Tk 5,000", engine._SALARY_LABELS, spy) == "Tk 5,000"
+    assert not spy.used
+
+
+def test_iter_currency_salaries_overlap(engine):
+    """Test a currency ending an amount-first match also starts its own match."""
+    matches = [match.group() for match in engine._iter_currency_salaries("Road 10, Tk 25,000")]
+
+    assert matches == ["10, Tk", "Tk 25,000"]
+
+
+@pytest.mark.parametrize("text,expected", SALARY_PRECEDENCE_CASES)
+def test_salary_precedence(engine, text, expected):
+    """Test the most trusted currency match wins wherever it appears."""
+    assert engine.extract_salary_regex(text) == expected
+
+
+@pytest.mark.parametrize("text,expected", LOCATION_KEYWORD_CASES)
+def test_location_keywords(engine, text, expected):
+    """Test city, area and whole-word remote keywords are found."""
+    assert engine.extract_location_regex(text) == expected
+
+
+@pytest.mark.parametrize("text,expected", FAST_DATES)
+def test_parse_date_fast(text, expected):
+    """Test fixed formats parse to local midnight and others are left to dateparser."""
+    if expected is not None:
+        expected = config.TIMEZONE.localize(expected)
+
+    assert extractor._parse_date_fast(text) == expected
+
+
+def test_slice_around_window_bounds():
+    """Test the window keeps WINDOW_BEFORE characters before the keyword and WINDOW_AFTER from it."""
+    text = "a" * 1000 + "Salary: Tk 5,000" + "b" * 1000
+    keyword = text.index("Salary:")
+
+    window = extractor._slice_around(text, WINDOW_KEYWORDS)
+
+    assert window == text[keyword - extractor.WINDOW_BEFORE:keyword + extractor.WINDOW_AFTER]
+    assert len(window) == extractor.WINDOW_BEFORE + extractor.WINDOW_AFTER
+
+
+def test_slice_around_clamps_at_start():
+    """Test a keyword near the start keeps everything before it."""
+    text = "Pay: BDT 5,000 " + "b" * 1000
+
+    assert extractor._slice_around(text, WINDOW_KEYWORDS) == text[:text.index("BDT") + extractor.WINDOW_AFTER]
+
+
+def test_slice_around_prefers_stronger_group():
+    """Test the strongest group wins even when a weaker keyword comes first."""
+    text = "Tk " + "a" * 1000 + "SALARY: 5,000" + "b" * 1000
+    keyword = text.index("SALARY:")
+
+    assert extractor._slice_around(text, WINDOW_KEYWORDS).startswith(text[keyword - extractor.WINDOW_BEFORE:keyword])
+
+
+@pytest.mark.parametrize("text", [
+    "No pay details here " * 100,
+    # casefold() lengthens "ß", so positions would not line up
+    "Straße " * 50 + "Salary: Tk 5,000" + "b" * 1000,
+])
+def test_slice_around_whole_text(text):
+    """Test texts without a usable keyword position are sent whole."""
+    assert extractor._slice_around(text, WINDOW_KEYWORDS) == text
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
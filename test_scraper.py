@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for turning fetched HTML pages into text, with the network replaced
+by local stand-ins.
+
+Run with pytest (or directly: python test_scraper.py).
+"""
+
+import asyncio
+import io
+import sys
+import httpx
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+import scraper
+
+
+# Bengali posting long enough to count as page text
+BENGALI_TEXT = "ঢাকা অফিসে সফটওয়্যার ইঞ্জিনিয়ার পদে নিয়োগ। আবেদনের শেষ তারিখ ১৫ মার্চ ২০২৭। বেতন আলোচনা সাপেক্ষে। গুলশান, ঢাকা।"
+# UTF-8 page that declares no charset anywhere
+BENGALI_PAGE = f"<html><body><p>{BENGALI_TEXT}</p></body></html>".encode('utf-8')
+
+# (body, Content-Type header, encoding used)
+CHARSET_CASES = [
+    (BENGALI_PAGE, 'text/html', 'utf-8'),
+    (BENGALI_PAGE, None, 'utf-8'),
+    (b'<html><head><meta charset="windows-1252"></head></html>', 'text/html', 'cp1252'),
+    (b'<meta http-equiv="Content-Type" content="text/html; charset=ISO-8859-1">', None, 'iso8859-1'),
+    # The header wins over the page's own declaration
+    (b'<meta charset="windows-1252">', 'text/html; charset=UTF-8', 'utf-8'),
+    (b'\xef\xbb\xbf<html></html>', 'text/html; charset=windows-1252', 'utf-8-sig'),
+    (b'<meta charset="no-such-charset">', None, 'utf-8'),
+]
+
+
+@pytest.mark.parametrize("content,content_type,expected", CHARSET_CASES)
+def test_html_charset(content, content_type, expected):
+    """Test the page encoding comes from the BOM, header, <meta> tag or UTF-8 default."""
+    assert scraper._html_charset(content, content_type) == expected
+
+
+def test_html_to_text_declared_charsets():
+    """Test pages in a declared single-byte charset decode correctly."""
+    page = f"<html><head><meta charset='windows-1252'></head><body><p>Café {'x' * 100}</p></body></html>"
+    content = page.encode('cp1252')
+
+    assert scraper._html_to_text(scraper._decode(content, scraper._html_charset(content, None))).startswith('Café')
+
+
+def test_html_to_text_xml_declaration():
+    """Test XHTML pages with an encoding declaration still parse."""
+    page = f'<?xml version="1.0" encoding="utf-8"?><html><body><p>{BENGALI_TEXT}</p></body></html>'
+
+    assert scraper._html_to_text(page) == BENGALI_TEXT
+
+
+def test_fetch_with_lxml_undeclared_utf8(monkeypatch):
+    """Test a UTF-8 Bengali page without a charset is not read as latin-1."""
+    class FakeSession:
+        def get(self, url, **kwargs):
+            response = requests.Response()
+            response.status_code = 200
+            response.headers = CaseInsensitiveDict({'Content-Type': 'text/html'})
+            response.raw = io.BytesIO(BENGALI_PAGE)
+            return response
+
+    monkeypatch.setattr(scraper, '_get_session', FakeSession)
+
+    assert scraper._fetch_with_lxml('https://jobs.example/post') == BENGALI_TEXT
+
+
+def test_fetch_async_undeclared_utf8(monkeypatch, tmp_path):
+    """Test the async direct-fetch fallback decodes undeclared UTF-8 pages too."""
+    def handler(request):
+        if request.url.host == 'r.jina.ai':
+            return httpx.Response(500)
+        return httpx.Response(200, headers={'Content-Type': 'text/html'}, content=BENGALI_PAGE)
+
+    async def fetch():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            monkeypatch.setattr(scraper, '_async_client', client)
+            return await scraper.fetch_job_text_async('https://jobs.example/post')
+
+    monkeypatch.setattr(scraper.config, 'SCRAPE_CACHE_DIR', str(tmp_path))
+    result = asyncio.run(fetch())
+
+    assert result['source'] == 'lxml'
+    assert result['text'] == BENGALI_TEXT
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
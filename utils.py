@@ -4,6 +4,7 @@ Helper utility functions for the Job Deadline Tracker Bot.
 
 import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional, Dict
 from urllib.parse import urlparse
 import config
@@ -12,6 +13,28 @@ import config
 DEFAULT_COMPANY = 'Unknown Company'
 DEFAULT_POSITION = 'Unknown Position'
 
+# URL detection pattern that avoids trailing punctuation
+_URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+_NUM_RE = re.compile(r'\d+')
+
+# English month names for deadline display (same as strftime's %B/%b in
+# the default C locale)
+_MONTHS_FULL = (
+    'January', 'February', 'March', 'April', 'May', 'June',
+    'July', 'August', 'September', 'October', 'November', 'December'
+)
+_MONTHS_ABBR = tuple(month[:3] for month in _MONTHS_FULL)
+
+# Job-related keywords that indicate a job description
+JOB_KEYWORDS = (
+    'job title', 'position', 'company', 'responsibilities',
+    'requirements', 'qualifications', 'salary', 'apply',
+    'deadline', 'hiring', 'vacancy', 'career', 'role',
+    'work experience', 'education', 'skills required',
+    'employment', 'job description', 'compensation',
+    'benefits', 'workplace', 'office', 'intern', 'internship'
+)
+
 
 def _get_or_default(value, default):
     """
@@ -30,6 +53,16 @@ def _get_or_default(value, default):
     return value
 
 
+def _format_date_long(dt: datetime) -> str:
+    """Format a date like strftime('%B %d, %Y'), e.g. 'March 05, 2026'."""
+    return f"{_MONTHS_FULL[dt.month - 1]} {dt.day:02d}, {dt.year}"
+
+
+def _format_date_short(dt: datetime) -> str:
+    """Format a date like strftime('%b %d, %Y'), e.g. 'Mar 05, 2026'."""
+    return f"{_MONTHS_ABBR[dt.month - 1]} {dt.day:02d}, {dt.year}"
+
+
 def is_valid_url(url: str) -> bool:
     """
     Validate URL format.
@@ -38,26 +71,32 @@ def is_valid_url(url: str) -> bool:
         url: URL string to validate
         
     Returns:
-        True if valid URL, False otherwise
+        True if valid http(s) URL with a host, False otherwise
     """
+    # Cheap prefix check before running the URL parser
+    if not isinstance(url, str) or not url[:8].lower().startswith(('http://', 'https://')):
+        return False
+    
     try:
-        result = urlparse(url)
-        return all([result.scheme, result.netloc])
+        return bool(urlparse(url).netloc)
     except Exception:
         return False
 
 
-def calculate_days_left(deadline: datetime) -> int:
+def calculate_days_left(deadline: datetime, now: Optional[datetime] = None) -> int:
     """
     Calculate days until deadline.
     
     Args:
         deadline: Deadline datetime object
+        now: Current time, to reuse one reading across many deadlines
+            (defaults to the current time in the configured timezone)
         
     Returns:
         Number of days until deadline (negative if passed)
     """
-    now = datetime.now(config.TIMEZONE)
+    if now is None:
+        now = datetime.now(config.TIMEZONE)
     if deadline.tzinfo is None:
         deadline = config.TIMEZONE.localize(deadline)
     
@@ -84,36 +123,41 @@ def format_job_message(job_data: Dict) -> str:
     url = job_data.get('url')
     
     # Build message
-    message = "✅ **Job Added Successfully!**\n\n"
-    
-    message += f"🏢 **Company:** {company}\n"
-    message += f"💼 **Position:** {position}\n"
+    parts = [
+        "✅ **Job Added Successfully!**\n\n",
+        f"🏢 **Company:** {company}\n",
+        f"💼 **Position:** {position}\n",
+    ]
     
     if deadline:
         # Use isinstance for proper type checking
-        deadline_str = deadline.strftime('%B %d, %Y') if isinstance(deadline, datetime) else str(deadline)
-        days_left = calculate_days_left(deadline) if isinstance(deadline, datetime) else None
-        message += f"📅 **Deadline:** {deadline_str}"
+        if isinstance(deadline, datetime):
+            deadline_str = _format_date_long(deadline)
+            days_left = calculate_days_left(deadline)
+        else:
+            deadline_str = str(deadline)
+            days_left = None
+        parts.append(f"📅 **Deadline:** {deadline_str}")
         if days_left is not None:
-            message += f" ({days_left} days left)"
-        message += "\n"
+            parts.append(f" ({days_left} days left)")
+        parts.append("\n")
     else:
-        message += "📅 **Deadline:** Not specified\n"
+        parts.append("📅 **Deadline:** Not specified\n")
     
     if salary:
-        message += f"💰 **Salary:** {salary}\n"
+        parts.append(f"💰 **Salary:** {salary}\n")
     
     if location:
-        message += f"📍 **Location:** {location}\n"
+        parts.append(f"📍 **Location:** {location}\n")
     
     if url:
-        message += f"🔗 **Apply:** {url}\n"
+        parts.append(f"🔗 **Apply:** {url}\n")
     else:
-        message += "⚠️ **Note:** No application link available\n"
+        parts.append("⚠️ **Note:** No application link available\n")
     
-    message += "\n✨ Saved to your Google Sheet!"
+    parts.append("\n✨ Saved to your Google Sheet!")
     
-    return message
+    return "".join(parts)
 
 
 def format_reminder_message(job_data: Dict, days_left: int) -> str:
@@ -137,21 +181,19 @@ def format_reminder_message(job_data: Dict, days_left: int) -> str:
         header = "🔔 DEADLINE REMINDER"
         time_msg = f"⏰ {days_left} days left to apply!"
     
-    message_parts = [header, "", time_msg, ""]
-    
-    if job_data.get('company'):
-        message_parts.append(f"🏢 {job_data['company']}")
-    
-    if job_data.get('position'):
-        message_parts.append(f"💼 {job_data['position']}")
-    
-    if job_data.get('deadline'):
-        deadline_str = job_data['deadline']
-        if isinstance(job_data['deadline'], datetime):
-            deadline_str = job_data['deadline'].strftime('%B %d, %Y')
-        message_parts.append(f"📅 Deadline: {deadline_str}")
-    
-    return "\n".join(message_parts)
+    company = job_data.get('company')
+    position = job_data.get('position')
+    deadline = job_data.get('deadline')
+    if isinstance(deadline, datetime):
+        deadline = _format_date_long(deadline)
+    
+    # Fixed layout, so build it in one expression
+    return (
+        f"{header}\n\n{time_msg}\n"
+        + (f"\n🏢 {company}" if company else "")
+        + (f"\n💼 {position}" if position else "")
+        + (f"\n📅 Deadline: {deadline}" if deadline else "")
+    )
 
 
 def format_deadline_list(jobs: list) -> str:
@@ -179,7 +221,7 @@ def format_deadline_list(jobs: list) -> str:
         status_icon = "✓" if status == "Applied" else ""
         
         if isinstance(deadline, datetime):
-            deadline_str = deadline.strftime('%b %d, %Y')
+            deadline_str = _format_date_short(deadline)
             message_parts.append(
                 f"{idx}️⃣ {position} @ {company}\n"
                 f"   📅 {deadline_str} ({days_left} days) - {status} {status_icon}\n"
@@ -228,10 +270,15 @@ def parse_job_number(text: str) -> Optional[int]:
         Job number or None if invalid
     """
     try:
-        # Extract number from text
-        numbers = re.findall(r'\d+', text)
-        if numbers:
-            return int(numbers[0])
+        # Usually the input is just the number
+        stripped = text.strip()
+        if stripped.isdecimal():
+            return int(stripped)
+        
+        # Extract the first number from text
+        match = _NUM_RE.search(text)
+        if match:
+            return int(match.group(0))
     except Exception:
         pass
     return None
@@ -257,9 +304,7 @@ def extract_url(text: str) -> Optional[str]:
     Returns:
         URL string or None if not found
     """
-    # URL detection pattern that avoids trailing punctuation
-    url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-    match = re.search(url_pattern, text)
+    match = _URL_RE.search(text)
     if match:
         url = match.group(0)
         # Remove common trailing punctuation if present
@@ -268,9 +313,29 @@ def extract_url(text: str) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=16)
+def lowercase(text: str) -> str:
+    """
+    Lowercase a message once for everything that scans it (job description
+    detection, then each extractor); lower() is slow on Bengali text,
+    which takes a non-ASCII path.
+    
+    Args:
+        text: Message or job posting text
+        
+    Returns:
+        text.lower()
+    """
+    return text.lower()
+
+
+# Repeated or forwarded messages are answered without rescanning; Telegram
+# caps messages at 4096 characters, which bounds the cache's memory
+@lru_cache(maxsize=256)
 def detect_job_description(text: str) -> bool:
     """
     Detect if text looks like a job description.
+    Results are cached.
     
     Args:
         text: Text to analyze
@@ -278,18 +343,18 @@ def detect_job_description(text: str) -> bool:
     Returns:
         True if text appears to be a job description, False otherwise
     """
-    # Job-related keywords that indicate a job description
-    job_keywords = [
-        'job title', 'position', 'company', 'responsibilities', 
-        'requirements', 'qualifications', 'salary', 'apply',
-        'deadline', 'hiring', 'vacancy', 'career', 'role',
-        'work experience', 'education', 'skills required',
-        'employment', 'job description', 'compensation',
-        'benefits', 'workplace', 'office', 'intern', 'internship'
-    ]
-    
-    text_lower = text.lower()
-    keyword_count = sum(1 for keyword in job_keywords if keyword in text_lower)
+    # Short messages are never treated as job descriptions
+    if len(text) <= 100:
+        return False
     
-    # If text is >100 chars and has 3+ job keywords, likely a job description
-    return len(text) > 100 and keyword_count >= 3
+    # 3+ job keywords means it is likely a job description; stop counting
+    # as soon as the third one turns up
+    text_lower = lowercase(text)
+    keyword_count = 0
+    for keyword in JOB_KEYWORDS:
+        if keyword in text_lower:
+            keyword_count += 1
+            if keyword_count >= 3:
+                return True
+    
+    return False